@@ -1,33 +1,59 @@
 import asyncio
+import os
 from pathlib import Path
-import subprocess
+import signal
 import sys
 from watchfiles import awatch, Change
 
+# Run the bot in its own session (POSIX) so a restart signals the whole
+# process group, including any ffmpeg children. Output is not piped, so
+# there's no pipe buffer to fill up and stall wait().
+_NEW_SESSION = hasattr(os, "killpg")
+
+
+def _signal(proc, sig):
+    try:
+        if _NEW_SESSION:
+            os.killpg(proc.pid, sig)
+        else:
+            proc.send_signal(sig)
+    except ProcessLookupError:
+        pass  # already exited
+
+
+async def _stop(proc):
+    _signal(proc, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        _signal(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+        await proc.wait()
+
+
 async def run_dev():
     while True:
         print("Starting bot...")
-        proc = subprocess.Popen(
-            [sys.executable, 'run.py'],
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, 'run.py',
             cwd=Path.cwd(),
+            start_new_session=_NEW_SESSION,
         )
         print("Bot started. Watching for file changes in src/...")
 
-        async for changes in awatch(Path('src')):
-            for change_type, path in changes:
-                if change_type in (Change.modified, Change.added, Change.deleted) and path.suffix == '.py':
-                    print(f"Detected {change_type.name}: {path.relative_to(Path.cwd())}")
-                    # Terminate the process
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()
-                        proc.wait()
-                    print("Restarting bot due to file changes...")
-                    break
-            else:
+        # watchfiles already groups a burst of saves (format-on-save, checkout)
+        # into one batch; restart at most once per batch.
+        async for changes in awatch(Path('src'), debounce=300, step=50):
+            hits = [
+                p for ct, p in changes
+                if ct in (Change.modified, Change.added, Change.deleted) and Path(p).suffix == '.py'
+            ]
+            if not hits:
                 continue
+            for p in hits:
+                print(f"Detected change: {Path(p).relative_to(Path.cwd())}")
+            # Terminate the process group
+            await _stop(proc)
+            print("Restarting bot due to file changes...")
             break
 
 if __name__ == '__main__':
@@ -1,4 +1,3 @@
-from dotenv import load_dotenv
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -6,5 +5,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from src.bot import bot
 
 if __name__ == '__main__':
-    load_dotenv()
+    # Optional: libuv-backed event loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     bot.run(os.getenv('BOT_TOKEN'))
\ No newline at end of file
@@ -1,13 +1,11 @@
 import os
 from dotenv import load_dotenv
 import discord
-import discord.opus  # For voice support
 from discord.ext import commands
-from discord import app_commands
-from collections import defaultdict
-import json
 import asyncio
-from src.data.persistence import load_data, save_data
+import logging
+import time
+from weakref import WeakKeyDictionary
 from src.data.db import init_db
 
 
@@ -23,6 +21,21 @@ class MusicHelpCommand(commands.HelpCommand):
       • Hides admin-only commands from normal !help
       • Adds !help admin for admins to see admin-only commands
     """
+    # Class-level caches: discord.py copies the help command per invocation,
+    # so per-instance state would be thrown away after every !help.
+    # Per-command caches are keyed by the Command object itself (weakly), so a
+    # reloaded command can never inherit a dead one's entry through id() reuse.
+    _admin_cache: WeakKeyDictionary = WeakKeyDictionary()  # command -> is admin-only
+    _help_fp: frozenset | None = None   # command set (and hidden/enabled state) the caches were built for
+    _help_cache: dict = {}              # prefix -> pre-formatted help lines
+    _sig_cache: WeakKeyDictionary = WeakKeyDictionary()    # command -> {prefix: `signature`}
+    _visible_cache: dict = {}           # (guild, perms, section) -> (expires_at, lines)
+    _VISIBLE_TTL = 60.0                 # seconds a visible-lines entry is reused
+    _subs_cache: WeakKeyDictionary = WeakKeyDictionary()   # group -> subcommand lines
+
+    # __qualname__ prefixes of the discord.py permission-check predicates
+    _PERM_CHECKS = ("has_permissions.", "has_guild_permissions.")
+
     def __init__(self):
         super().__init__(command_attrs={
             "help": "Show help",
@@ -41,21 +54,29 @@ class MusicHelpCommand(commands.HelpCommand):
 
     def _is_admin_command(self, command: commands.Command) -> bool:
         """
-        Heuristic: detect commands decorated with @commands.has_permissions(administrator=True)
-        by inspecting their checks' closures.
+        Detect commands decorated with @commands.has_permissions(administrator=True).
+        Only has_permissions predicates are inspected, and only their `perms`
+        closure variable is read. Cached per command.
         """
+        cached = self._admin_cache.get(command)
+        if cached is not None:
+            return cached
+
+        result = False
         for check in getattr(command, "checks", []):
-            closure = getattr(check, "__closure__", None)
-            if not closure:
+            if not getattr(check, "__qualname__", "").startswith(self._PERM_CHECKS):
+                continue
+            cells = dict(zip(check.__code__.co_freevars, check.__closure__ or ()))
+            try:
+                perms = cells["perms"].cell_contents
+            except (KeyError, ValueError):
                 continue
-            for cell in closure:
-                try:
-                    val = cell.cell_contents
-                except ValueError:
-                    continue
-                if isinstance(val, dict) and val.get("administrator"):
-                    return True
-        return False
+            if isinstance(perms, dict) and perms.get("administrator"):
+                result = True
+                break
+
+        self._admin_cache[command] = result
+        return result
 
     async def command_callback(self, ctx, *, command: str | None = None):
         """
@@ -64,6 +85,16 @@ class MusicHelpCommand(commands.HelpCommand):
         """
         self.context = ctx
 
+        # Commands were added/removed, (re)loaded, hidden or disabled: drop stale caches
+        fp = self._help_fingerprint(ctx.bot)
+        if fp != self._help_fp:
+            MusicHelpCommand._admin_cache.clear()
+            MusicHelpCommand._sig_cache.clear()
+            MusicHelpCommand._subs_cache.clear()
+            MusicHelpCommand._visible_cache.clear()
+            MusicHelpCommand._help_cache.clear()
+            MusicHelpCommand._help_fp = fp
+
         if command and command.lower() == "admin":
             # Only admins can see this view
             if not (ctx.guild and ctx.author.guild_permissions.administrator):
@@ -81,52 +112,148 @@ class MusicHelpCommand(commands.HelpCommand):
         # Default behaviour: !help, !help foo, !help RadioBot, etc.
         return await super().command_callback(ctx, command=command)
 
+    @staticmethod
+    def _help_fingerprint(bot) -> frozenset:
+        # Command objects are recreated on reload and compare by identity, so this
+        # catches reloads that keep the command count, plus runtime hidden/enabled toggles.
+        return frozenset((c, c.hidden, c.enabled) for c in bot.walk_commands())
+
+    def _cmd_line(self, cmd: commands.Command) -> str:
+        brief = cmd.brief or (cmd.help.splitlines()[0] if cmd.help else "—")
+        line = f"• {self._fmt_sig(cmd)} — {self._shorten(brief, self._LINE_CHAR_LIMIT)}"
+        return self._shorten(line, self._LINE_CHAR_LIMIT + 20)
+
+    def _build_help_cache(self, bot) -> dict:
+        """
+        Format every help line once per (command set, prefix):
+          cogs:  {cog_name: [(cmd, line), ...]}  (admin-only excluded)
+          admin: [(cmd, line), ...]
+          slash: [line, ...]
+        Per-user permission filtering still happens at send time.
+        """
+        ctx = getattr(self, "context", None)
+        prefix = (getattr(ctx, "clean_prefix", None) or getattr(ctx, "prefix", None) or "!") if ctx else "!"
+        cached = self._help_cache.get(prefix)
+        if cached is not None:
+            return cached
+
+        cogs: dict[str, list] = {}
+        for cog in bot.cogs.values():
+            cog_name = getattr(cog, "qualified_name", None)
+            if not cog_name:
+                continue
+            entries = [
+                (c, self._cmd_line(c))
+                for c in sorted(cog.get_commands(), key=lambda x: x.qualified_name)
+                if not c.hidden and c.enabled and not self._is_admin_command(c)
+            ]
+            if entries:
+                cogs[cog_name] = entries
+
+        admin = [
+            (c, self._cmd_line(c))
+            for c in sorted(bot.commands, key=lambda x: x.name)
+            if not c.hidden and c.enabled and self._is_admin_command(c)
+        ]
+
+        try:
+            tree = bot.tree  # type: ignore[attr-defined]
+            app_cmds = [c for c in tree.get_commands() if c.enabled]
+        except Exception:
+            app_cmds = []
+        slash = []
+        for ac in sorted(app_cmds, key=lambda c: c.name):
+            desc = (ac.description or "—").splitlines()[0]
+            slash.append(self._shorten(f"• `/{ac.name}` — {desc}", self._LINE_CHAR_LIMIT))
+
+        cached = {"cogs": cogs, "admin": admin, "slash": slash}
+        MusicHelpCommand._help_cache[prefix] = cached
+        return cached
+
+    async def _visible_lines(self, section: str, entries) -> list[str]:
+        """
+        Lines of `entries` the invoker may run. The only checks in use are
+        permission checks, so the result is shared by everyone with the same
+        channel permissions for ~60s instead of re-running filter_commands.
+        """
+        ctx = self.context
+        perms = getattr(ctx, "permissions", None)
+        key = (ctx.guild.id if ctx.guild else 0, perms.value if perms else 0, section)
+        now = time.monotonic()
+        hit = self._visible_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        allowed = set(await self.filter_commands([c for c, _ in entries]))
+        lines = [line for c, line in entries if c in allowed]
+        cache = self._visible_cache
+        if len(cache) > 512:
+            for k in [k for k, (exp, _) in cache.items() if exp <= now]:
+                del cache[k]
+        cache[key] = (now + self._VISIBLE_TTL, lines)
+        return lines
+
     def _fmt_sig(self, command: commands.Command) -> str:
         # Prefer the context's cleaned prefix; fall back to raw prefix or "!"
         ctx = getattr(self, "context", None)
         prefix = "!"
         if ctx is not None:
             prefix = getattr(ctx, "clean_prefix", None) or getattr(ctx, "prefix", None) or "!"
-        signature = f"{prefix}{command.qualified_name} {command.signature}".strip()
-        return f"`{signature}`"
+        sigs = self._sig_cache.get(command)
+        if sigs is None:
+            sigs = self._sig_cache[command] = {}
+        cached = sigs.get(prefix)
+        if cached is None:
+            # command.signature walks the params; build it once per command
+            signature = f"{prefix}{command.qualified_name} {command.signature}".strip()
+            cached = sigs[prefix] = f"`{signature}`"
+        return cached
 
     def _shorten(self, s: str, limit: int) -> str:
-        s = (s or "—").strip()
+        if not s:
+            return "—"
+        # Fast path: already short and trimmed (the common case), no new string
+        if len(s) <= limit and not s[0].isspace() and not s[-1].isspace():
+            return s
+        s = s.strip() or "—"
         return s if len(s) <= limit else (s[: limit - 1] + "…")
 
-    def _chunk_lines(self, lines, max_chars) -> list[list[str]]:
+    def _chunk_lines(self, lines, max_chars) -> list[str]:
         """
         Greedy-pack lines into chunks where each chunk's joined length <= max_chars.
-        Adds '\n' between lines when measuring.
+        Returns the chunks already '\n'-joined, ready to use as field values.
         """
+        lines = [ln.rstrip() for ln in lines]
         chunks = []
-        cur = []
-        cur_len = 0
-        for ln in lines:
-            ln = ln.rstrip()
-            add_len = len(ln) + (1 if cur else 0)  # + newline if not first
-            if cur and (cur_len + add_len) > max_chars:
-                chunks.append(cur)
-                cur = [ln]
-                cur_len = len(ln)
-            else:
-                if cur:
-                    cur_len += 1 + len(ln)
-                    cur.append(ln)
-                else:
-                    cur = [ln]
-                    cur_len = len(ln)
-        if cur:
-            chunks.append(cur)
+        start = 0
+        running = -1  # the first line in a chunk has no leading newline
+        for i, n in enumerate(map(len, lines)):
+            if i > start and running + 1 + n > max_chars:
+                chunks.append("\n".join(lines[start:i]))
+                start, running = i, -1
+            running += 1 + n
+        if start < len(lines):
+            chunks.append("\n".join(lines[start:]))
         return chunks
 
     async def _send_embeds_paginated(self, embeds: list[discord.Embed]):
         """
-        Sends a sequence of embeds. (Minimal wrapper, but keeps callsites clean.)
+        Sends a sequence of embeds, packing as many as Discord allows into each
+        message (10 embeds / 6000 chars) so multi-page help is one round-trip.
+        Messages still go out in order.
         """
         dest = self.get_destination()
+        batch: list[discord.Embed] = []
+        batch_len = 0
         for e in embeds:
-            await dest.send(embed=e)
+            n = len(e)
+            if batch and (len(batch) >= 10 or batch_len + n > 6000):
+                await dest.send(embeds=batch)
+                batch, batch_len = [], 0
+            batch.append(e)
+            batch_len += n
+        if batch:
+            await dest.send(embeds=batch)
 
     async def send_admin_help(self):
         """
@@ -134,18 +261,14 @@ class MusicHelpCommand(commands.HelpCommand):
         Auto-updates based on actual registered commands.
         """
         ctx = self.context
-        EMBED_COLOR = getattr(self, "_EMBED_COLOR", 0x0099FF)
-        LINE_CHAR_LIMIT = getattr(self, "_LINE_CHAR_LIMIT", 140)
-        FIELD_CHAR_LIMIT = getattr(self, "_FIELD_CHAR_LIMIT", 1024)
+        EMBED_COLOR = self._EMBED_COLOR
+        FIELD_CHAR_LIMIT = self._FIELD_CHAR_LIMIT
 
-        # All prefix commands, filtered to ones the *invoker* can run
-        all_commands = [c for c in ctx.bot.commands if not c.hidden and c.enabled]
-        accessible = await self.filter_commands(all_commands, sort=True)
+        # Pre-formatted admin commands, filtered to ones the *invoker* can run
+        entries = self._build_help_cache(ctx.bot)["admin"]
+        admin_lines = await self._visible_lines("admin", entries)
 
-        # Only commands that actually require administrator permission
-        admin_cmds = [c for c in accessible if self._is_admin_command(c)]
-
-        if not admin_cmds:
+        if not admin_lines:
             embed = discord.Embed(
                 title="🛠 Admin Commands",
                 description="No admin-only commands are currently registered.",
@@ -154,13 +277,7 @@ class MusicHelpCommand(commands.HelpCommand):
             await self.get_destination().send(embed=embed)
             return
 
-        lines: list[str] = []
-        for cmd in admin_cmds:
-            brief = cmd.brief or (cmd.help.splitlines()[0] if cmd.help else "—")
-            line = f"• {self._fmt_sig(cmd)} — {self._shorten(brief, LINE_CHAR_LIMIT)}"
-            lines.append(self._shorten(line, LINE_CHAR_LIMIT + 20))
-
-        chunks = self._chunk_lines(lines, FIELD_CHAR_LIMIT) or [["—"]]
+        chunks = self._chunk_lines(admin_lines, FIELD_CHAR_LIMIT) or ["—"]
 
         embeds: list[discord.Embed] = []
         title = "🛠 Admin Commands"
@@ -171,7 +288,7 @@ class MusicHelpCommand(commands.HelpCommand):
                 color=EMBED_COLOR,
                 description="Commands that require administrator permissions." if i == 1 else None,
             )
-            e.add_field(name="Commands", value="\n".join(chunk), inline=False)
+            e.add_field(name="Commands", value=chunk, inline=False)
             embeds.append(e)
 
         await self._send_embeds_paginated(embeds)
@@ -184,153 +301,61 @@ class MusicHelpCommand(commands.HelpCommand):
           - Paginates if >25 fields
           - Includes slash commands
           - Hides admin-only commands from normal view
+        `mapping` is ignored in favour of the cached, pre-formatted lines.
         """
-        # ---- Local limits / styling (safe defaults if class attrs not present) ----
-        FIELD_CHAR_LIMIT = getattr(self, "_FIELD_CHAR_LIMIT", 1024)
-        MAX_FIELDS_PER_EMBED = getattr(self, "_MAX_FIELDS_PER_EMBED", 25)
-        LINE_CHAR_LIMIT = getattr(self, "_LINE_CHAR_LIMIT", 140)
-        EMBED_COLOR = getattr(self, "_EMBED_COLOR", 0x0099FF)
-
-        # ---- Fallback helpers if the class doesn't define them ----
-        def _shorten(s: str, limit: int) -> str:
-            s = (s or "—").strip()
-            return s if len(s) <= limit else (s[: limit - 1] + "…")
-
-        def _fmt_sig_local(command: commands.Command) -> str:
-            ctx = getattr(self, "context", None)
-            prefix = "!"
-            if ctx is not None:
-                prefix = getattr(ctx, "clean_prefix", None) or getattr(ctx, "prefix", None) or "!"
-            signature = f"{prefix}{command.qualified_name} {command.signature}".strip()
-            return f"`{signature}`"
-
-        fmt_sig = getattr(self, "_fmt_sig", _fmt_sig_local)
-
-        def _chunk_lines(lines, max_chars) -> list[list[str]]:
-            chunks = []
-            cur = []
-            cur_len = 0
-            for ln in lines:
-                ln = ln.rstrip()
-                add_len = len(ln) + (1 if cur else 0)  # newline if not first in chunk
-                if cur and (cur_len + add_len) > max_chars:
-                    chunks.append(cur)
-                    cur = [ln]
-                    cur_len = len(ln)
-                else:
-                    if cur:
-                        cur.append(ln)
-                        cur_len += add_len
-                    else:
-                        cur = [ln]
-                        cur_len = len(ln)
-            if cur:
-                chunks.append(cur)
-            return chunks
-
-        # ---- Embed pagination helpers ----
-        embeds = []
-        cur_embed = discord.Embed(
-            title="🎵 Bot Help",
-            description="Here’s what I can do right now. Use `!help <command>` for more details.",
-            color=EMBED_COLOR,
-        )
-        cur_fields = 0
-
-        def _flush_embed():
-            nonlocal cur_embed, cur_fields
-            if cur_fields > 0:
-                embeds.append(cur_embed)
-            cur_embed = discord.Embed(color=EMBED_COLOR)
-            cur_fields = 0
-
-        # ---- Prefix commands grouped by Cog (skip 'General'/None) ----
-        for cog, commands_list in mapping.items():
-            if cog is None:
-                continue  # skip uncategorized
-            cog_name = getattr(cog, "qualified_name", None)
-            if not cog_name:
-                continue
-
-            # Use built-in filter_commands so users only see what they can run
-            visible = await self.filter_commands(commands_list, sort=True)
-            # Extra safety: skip hidden/disabled and admin-only commands here
-            visible = [
-                c for c in visible
-                if not c.hidden and c.enabled and not self._is_admin_command(c)
-            ]
-            if not visible:
-                continue
+        # Lines are formatted once per command set; only permissions are per-user
+        cache = self._build_help_cache(self.context.bot)
 
-            lines = []
-            for cmd in sorted(visible, key=lambda x: x.qualified_name):
-                short = cmd.brief or (cmd.help.splitlines()[0] if cmd.help else "—")
-                line = f"• {fmt_sig(cmd)} — {_shorten(short, LINE_CHAR_LIMIT)}"
-                lines.append(_shorten(line, LINE_CHAR_LIMIT + 20))
-                if len(lines) >= 60:
-                    lines.append("…")
-                    break
+        # (field name, value) pairs; paginated into embeds at the end
+        fields: list[tuple[str, str]] = []
 
-            chunks = _chunk_lines(lines, FIELD_CHAR_LIMIT) or [["—"]]
+        def _add_section(section: str, lines: list[str]) -> None:
+            if len(lines) > 60:
+                lines = lines[:60] + ["…"]
+            chunks = self._chunk_lines(lines, self._FIELD_CHAR_LIMIT) or ["—"]
             for i, chunk in enumerate(chunks, start=1):
-                if cur_fields >= MAX_FIELDS_PER_EMBED:
-                    _flush_embed()
-                field_name = cog_name if i == 1 else f"{cog_name} (cont. {i})"
-                cur_embed.add_field(name=field_name, value="\n".join(chunk), inline=False)
-                cur_fields += 1
+                fields.append((section if i == 1 else f"{section} (cont. {i})", chunk))
 
-        # ---- Slash (app) commands ----
-        try:
-            tree = self.context.bot.tree  # type: ignore[attr-defined]
-            app_cmds = [c for c in tree.get_commands() if c.enabled]
-        except Exception:
-            app_cmds = []
+        # ---- Prefix commands grouped by Cog (skip 'General'/None) ----
+        for cog_name, entries in cache["cogs"].items():
+            # Users only see what they can run
+            lines = await self._visible_lines(cog_name, entries)
+            if lines:
+                _add_section(cog_name, lines)
 
-        if app_cmds:
-            lines = []
-            for ac in sorted(app_cmds, key=lambda c: c.name):
-                desc = (ac.description or "—").splitlines()[0]
-                lines.append(_shorten(f"• `/{ac.name}` — {desc}", LINE_CHAR_LIMIT))
-                if len(lines) >= 60:
-                    lines.append("…")
-                    break
+        # ---- Slash (app) commands ----
+        if cache["slash"]:
+            _add_section("Slash Commands", cache["slash"])
 
-            chunks = _chunk_lines(lines, FIELD_CHAR_LIMIT) or [["—"]]
-            for i, chunk in enumerate(chunks, start=1):
-                if cur_fields >= MAX_FIELDS_PER_EMBED:
-                    _flush_embed()
-                name = "Slash Commands" if i == 1 else f"Slash Commands (cont. {i})"
-                cur_embed.add_field(name=name, value="\n".join(chunk), inline=False)
-                cur_fields += 1
-
-        # ---- Finalize & send ----
-        if cur_fields == 0:
-            cur_embed.description = "No visible commands."
-            embeds.append(cur_embed)
-        else:
-            embeds.append(cur_embed)
+        # ---- Paginate (<=25 fields per embed) & send ----
+        color = self._EMBED_COLOR
+        embeds = [discord.Embed(
+            title="🎵 Bot Help",
+            description="Here’s what I can do right now. Use `!help <command>` for more details.",
+            color=color,
+        )]
+        if not fields:
+            embeds[0].description = "No visible commands."
+        per = self._MAX_FIELDS_PER_EMBED
+        for start in range(0, len(fields), per):
+            if start:
+                embeds.append(discord.Embed(color=color))
+            add = embeds[-1].add_field
+            for name, value in fields[start:start + per]:
+                add(name=name, value=value, inline=False)
 
-        dest = self.get_destination()
-        for e in embeds:
-            await dest.send(embed=e)
+        await self._send_embeds_paginated(embeds)
 
     async def send_cog_help(self, cog: commands.Cog):
         """
         Show commands for a single cog, chunked into fields by length.
         Admin-only commands are still hidden unless you explicitly do !help admin.
         """
-        all_lines = []
-        for command in sorted(cog.get_commands(), key=lambda x: x.qualified_name):
-            if command.hidden or not command.enabled:
-                continue
-            # Also hide admin-only commands from cog help, to keep consistent
-            if self._is_admin_command(command):
-                continue
-            brief = command.brief or (command.help.splitlines()[0] if command.help else "—")
-            line = f"• {self._fmt_sig(command)} — {self._shorten(brief, self._LINE_CHAR_LIMIT)}"
-            all_lines.append(self._shorten(line, self._LINE_CHAR_LIMIT + 20))
+        # Non-admin commands of this cog, already filtered and formatted
+        entries = self._build_help_cache(self.context.bot)["cogs"].get(cog.qualified_name, [])
+        all_lines = [line for _, line in entries]
 
-        chunks = self._chunk_lines(all_lines, self._FIELD_CHAR_LIMIT) or [["—"]]
+        chunks = self._chunk_lines(all_lines, self._FIELD_CHAR_LIMIT) or ["—"]
 
         embeds = []
         title = f"{cog.qualified_name} Commands"
@@ -355,7 +380,7 @@ class MusicHelpCommand(commands.HelpCommand):
 
         for i, chunk in enumerate(chunks, start=1):
             name = title if i == 1 else f"{title} (cont. {i})"
-            value = "\n".join(chunk)
+            value = chunk
             if fields_in_batch >= self._MAX_FIELDS_PER_EMBED:
                 _flush(title)
             batch.append((name, value))
@@ -377,19 +402,22 @@ class MusicHelpCommand(commands.HelpCommand):
 
         # Subcommands
         if isinstance(command, commands.Group) and command.commands:
-            subs = []
-            for sc in sorted(command.commands, key=lambda x: x.qualified_name):
-                if sc.hidden or not sc.enabled:
-                    continue
-                desc = sc.brief or (sc.help.splitlines()[0] if sc.help else "—")
-                line = f"• `{sc.qualified_name} {sc.signature}`: {self._shorten(desc, self._LINE_CHAR_LIMIT)}".strip()
-                subs.append(self._shorten(line, self._LINE_CHAR_LIMIT + 20))
+            subs = self._subs_cache.get(command)
+            if subs is None:
+                subs = []
+                for sc in sorted(command.commands, key=lambda x: x.qualified_name):
+                    if sc.hidden or not sc.enabled:
+                        continue
+                    desc = sc.brief or (sc.help.splitlines()[0] if sc.help else "—")
+                    line = f"• `{sc.qualified_name} {sc.signature}`: {self._shorten(desc, self._LINE_CHAR_LIMIT)}".strip()
+                    subs.append(self._shorten(line, self._LINE_CHAR_LIMIT + 20))
+                self._subs_cache[command] = subs
 
             # chunk subcommands into multiple fields if needed
-            chunks = self._chunk_lines(subs, self._FIELD_CHAR_LIMIT) or [["—"]]
+            chunks = self._chunk_lines(subs, self._FIELD_CHAR_LIMIT) or ["—"]
             for i, chunk in enumerate(chunks, start=1):
                 name = "Subcommands" if i == 1 else f"Subcommands (cont. {i})"
-                embed.add_field(name=name, value="\n".join(chunk), inline=False)
+                embed.add_field(name=name, value=chunk, inline=False)
 
         await self.get_destination().send(embed=embed)
 
@@ -404,7 +432,6 @@ intents.message_content = True
 intents.voice_states = True
 bot = commands.Bot(command_prefix='!', intents=intents, help_command=MusicHelpCommand())
 
-import logging, discord
 logging.basicConfig(level=logging.INFO)                 # or DEBUG for deeper
 discord.utils.setup_logging(level=logging.INFO, root=False)
 
@@ -412,9 +439,17 @@ discord.utils.setup_logging(level=logging.INFO, root=False)
 logging.getLogger("aiohttp.client").setLevel(logging.WARNING)
 logging.getLogger("discord.gateway").setLevel(logging.INFO)
 
+# on_ready fires again after every resume/reconnect; startup work runs once
+bot._ready_once = False
+
 
 @bot.event
 async def on_ready():
+    if bot._ready_once:
+        print(f"{bot.user} reconnected; skipping startup work")
+        return
+    bot._ready_once = True
+
     embed = discord.Embed(
         title="🌟 Connection Established",
         description=f'{bot.user} is now online and ready to rock! 🎸',
@@ -423,23 +458,31 @@ async def on_ready():
     )
     embed.add_field(name="Status", value="Ready to play music! 🎵", inline=False)
     print(embed)
-    # Load data for all guilds on startup
-    for guild in bot.guilds:
-        load_data(guild.id)
+    # Load data for all guilds on startup (file reads run off the event loop)
+    from src.data.persistence import load_data
+    await asyncio.gather(*(asyncio.to_thread(load_data, g.id) for g in bot.guilds))
+
+    # Load cogs and Opus concurrently; the dlopen runs in a worker thread
+    await asyncio.gather(
+        _load_extension('src.cogs.music', "music"),
+        _load_extension('src.cogs.stats', "stats"),
+        asyncio.to_thread(_load_opus),
+    )
+
+    # Sync slash commands in the background; it's an HTTP round-trip
+    bot._sync_task = asyncio.create_task(_sync_slash())
 
-    # Ensure cog is loaded
-    try:
-        await bot.load_extension('src.cogs.music')
-    except Exception as e:
-        print(f"Failed to load music cog: {e}")
 
-    # Ensure stat cog is loaded
+async def _load_extension(name: str, label: str):
     try:
-        await bot.load_extension('src.cogs.stats')
+        await bot.load_extension(name)
     except Exception as e:
-        print(f"Failed to load stats cog: {e}")
+        print(f"Failed to load {label} cog: {e}")
 
+
+def _load_opus():
     # Voice will use Opus if available
+    import discord.opus
     try:
         discord.opus.load_opus("libopus.so.0")
         if discord.opus.is_loaded():
@@ -450,10 +493,10 @@ async def on_ready():
         print(f"Failed to load Opus: {e}, disabling Opus for raw PCM")
         discord.opus.load_opus(None)
 
-    # Sync slash commands
+
+async def _sync_slash():
     try:
-        tree = bot.tree
-        synced = await tree.sync()
+        synced = await bot.tree.sync()
         print(f"Synced {len(synced)} slash command(s)")
     except Exception as e:
         print(f"Failed to sync slash commands: {e}")
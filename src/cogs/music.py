@@ -7,18 +7,25 @@ import asyncio
 import random
 import os
 import concurrent.futures
+import threading
 import time
 import re
 import datetime
 import csv
+import functools
+import itertools
+import bisect
 from pathlib import Path
+from typing import Iterator
 from discord.utils import escape_markdown
-from src.data.persistence import load_data, save_data
+from src.data.persistence import load_data, snapshot_data, write_data
 from src.utils.extractor import extract_song_info
+from src.data.meta_cache import get_meta, put_meta
 from src.utils.song_list_scraper import scrape_suno_songs
 from src.utils.prefetch import prefetch_to_file
 from src.data.db import like_track, unlike_track, get_like_count, get_user_like_count, top_liked_for_users
 from src.utils.shuffle_displacing_first import shuffle_displacing_first_inplace
+from src.utils.track_queue import TrackQueue
 from src.ui.queue_manager import QueueManagerView, build_queue_embed
 
 # === Play history DB (safe if module not present) ===========================
@@ -32,6 +39,7 @@ except Exception:
 # ===== Embed + Formatting Helpers ===========================================
 EMBED_COLOR_PLAYING = 0x580fd6
 EMBED_COLOR_ADDED   = 0xc1d4d6
+_UTC = datetime.timezone.utc
 
 # Commands whose *text* messages should be auto-deleted after successful run
 AUTO_DELETE_COMMANDS: set[str] = {"skip", "stop", "top", "history", "queue", "remove", "join" ,"leave"}
@@ -41,6 +49,8 @@ PREFETCH_MODE    = os.getenv("PREFETCH_MODE", "full").lower()  # "none" | "warmu
 PREFETCH_BYTES   = int(os.getenv("PREFETCH_BYTES", "524288"))    # ~512 KB for warmup
 PREFETCH_TIMEOUT = int(os.getenv("PREFETCH_TIMEOUT", "25"))      # seconds
 PREFETCH_DIR     = os.getenv("PREFETCH_DIR", "songs") or "songs"
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", "4"))  # parallel background prefetches
+PREFETCH_AHEAD       = int(os.getenv("PREFETCH_AHEAD", "3"))         # autofill tracks warmed on enqueue
 
 # ---- Startup polish & FFmpeg tuning --------------------------------------
 PREBUFFER_SECONDS       = float(os.getenv("PREBUFFER_SECONDS", "0.5"))   # wait before play() to fill buffers
@@ -58,6 +68,33 @@ FFMPEG_BUFFER_SIZE       = os.getenv("FFMPEG_BUFFER_SIZE", "512k")
 FFMPEG_MAX_DELAY_US      = int(os.getenv("FFMPEG_MAX_DELAY_US", "5000000"))
 VOICE_BITRATE_KBPS = int(os.getenv("VOICE_BITRATE_KBPS", "128"))
 
+# FFmpeg option sets (latency + stability tuned), built once from the env above
+_FFMPEG_AF = (
+    "aresample=async=1:min_hard_comp=0.10:first_pts=0,"
+    f"adelay={STARTUP_ADELAY_MS}|{STARTUP_ADELAY_MS}"
+)
+_FFMPEG_BASE_OPTS = (
+    f"-vn "
+    f"-probesize {FFMPEG_PROBESIZE} "
+    f"-analyzeduration {FFMPEG_ANALYZEDURATION} "
+    f"-thread_queue_size {FFMPEG_THREAD_QUEUE_SIZE} "
+    f"-buffer_size {FFMPEG_BUFFER_SIZE} "
+    f"-max_delay {FFMPEG_MAX_DELAY_US} "
+    f"-af {_FFMPEG_AF}"
+) + (" -fflags +nobuffer" if FFMPEG_NOBUFFER else "")
+_FFMPEG_STREAM = {
+    "before_options": (
+        "-reconnect 1 "
+        "-reconnect_streamed 1 "
+        "-reconnect_at_eof 1 "
+        "-reconnect_delay_max 5 "
+        f"-rw_timeout {FFMPEG_RW_TIMEOUT_US} "
+        "-nostdin"
+    ),
+    "options": _FFMPEG_BASE_OPTS,
+}
+_FFMPEG_LOCAL = {"options": _FFMPEG_BASE_OPTS}
+
 # Queue/playlist clear policy toggles
 CLEAR_PLAYLISTS_ON_STOP   = os.getenv("CLEAR_PLAYLISTS_ON_STOP", "0") == "1"
 CLEAR_PLAYLISTS_ON_RELOAD = os.getenv("CLEAR_PLAYLISTS_ON_RELOAD", "0") == "1"
@@ -69,6 +106,9 @@ AUTOFILL_MAX_PULL  = int(os.getenv("AUTOFILL_MAX_PULL", "50"))    # how many to
 DEFAULT_AUTOFILL_URL = os.getenv("DEFAULT_AUTOFILL_URL", "").strip()
 DEFAULT_AUTOFILL_CSV = os.getenv("DEFAULT_AUTOFILL_CSV", "").strip()
 AUTOFILL_LIKES_PER_USER = int(os.getenv("AUTOFILL_LIKES_PER_USER", "5"))
+# Declared seed-CSV layout ("url,requested_by") skips header sniffing; empty = auto-detect
+AUTOFILL_CSV_SCHEMA = os.getenv("AUTOFILL_CSV_SCHEMA", "").replace(" ", "").lower()
+_CSV_CACHE: dict[str, tuple[tuple[int, int], list[dict]]] = {}  # abspath -> ((mtime_ns, size), rows)
 
 # ---- Requester VC check ---------------------------------------------------
 SKIP_IF_REQUESTER_LEFT = os.getenv("SKIP_IF_REQUESTER_LEFT", "1") == "1"
@@ -82,16 +122,40 @@ QUEUE_MAX_PER_USER          = int(os.getenv("QUEUE_MAX_PER_USER", "3"))        #
 # ---- Now Playing pruning (autofill-only) -----------------------------------
 # Only prune NP cards that came from autofill tracks, once N subsequent songs have started.
 REMOVE_NP_AFTER_SONGS = int(os.getenv("REMOVE_NP_AFTER_SONGS", "2"))  # default=2 songs
+NP_MIN_INTERVAL_SEC   = float(os.getenv("NP_MIN_INTERVAL_SEC", "0.5"))  # min gap between NP cards per channel
+
+try:
+    RADIO_CONTROL_CHANNEL_ID = int(os.getenv("RADIO_CONTROL_CHANNEL") or 0) or None
+except ValueError:
+    RADIO_CONTROL_CHANNEL_ID = None
+
+# ---- Persistence (coalesced background writes) -----------------------------
+SAVE_DEBOUNCE_SEC = float(os.getenv("SAVE_DEBOUNCE_SEC", "0.5"))  # batch bursts of changes
+
+# ---- Bot presence ----------------------------------------------------------
+PRESENCE_MIN_INTERVAL_SEC = float(os.getenv("PRESENCE_MIN_INTERVAL_SEC", "12"))  # gateway allows ~5/min
 
-async def maybe_prefetch(song: dict) -> str | None:
+# ---- Track metadata resolution ----------------------------------------------
+RESOLVER_WORKERS = int(os.getenv("RESOLVER_WORKERS", "8"))  # long-lived extractor threads
+SCRAPE_POOL_SIZE = int(os.getenv("SCRAPE_POOL_SIZE", "8"))  # playlist/profile page scrapes
+USER_FETCH_CONCURRENCY = int(os.getenv("USER_FETCH_CONCURRENCY", "2"))  # in-flight scrapes/resolves per user
+IO_POOL_SIZE = int(os.getenv("IO_POOL_SIZE", "16"))  # prefetch downloads (warmup + full)
+SHUFFLE_DEPTH = int(os.getenv("SHUFFLE_DEPTH", "50"))  # !shuffle randomizes this many front slots; 0 = all
+
+async def maybe_prefetch(song: dict, executor: concurrent.futures.Executor | None = None) -> str | None:
     """
     Uses env PREFETCH_MODE to optionally warm up or fully cache the audio.
     Returns a local file path if a full download happened; otherwise None.
+    Downloads run on `executor` (the loop's default executor if None).
     """
     mode = PREFETCH_MODE
     if mode not in ("warmup", "full"):
         return None
 
+    local = song.get("local_file")
+    if local and os.path.exists(local):
+        return local  # already downloaded (e.g. by a background prefetch)
+
     url = str(song.get("url") or "").strip()
     if not url or url.startswith("songs/"):
         return None  # already local or no url
@@ -102,7 +166,7 @@ async def maybe_prefetch(song: dict) -> str | None:
     if mode == "warmup":
         # partial download then discard (prime CDN/TLS)
         await loop.run_in_executor(
-            None,
+            executor,
             lambda: prefetch_to_file(
                 url,
                 out_dir=PREFETCH_DIR,
@@ -116,7 +180,7 @@ async def maybe_prefetch(song: dict) -> str | None:
 
     # mode == "full"
     local_path = await loop.run_in_executor(
-        None,
+        executor,
         lambda: prefetch_to_file(
             url,
             out_dir=PREFETCH_DIR,
@@ -154,6 +218,11 @@ def _duration_to_seconds(d) -> int | None:
     s = str(d).strip()
     if not s:
         return None
+    return _parse_duration_str(s)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_duration_str(s: str) -> int | None:
+    """Cached 'HH:MM:SS'/'MM:SS'/'SS' parse; ETA lists re-read the same strings on every refresh."""
     parts = s.split(":")
     try:
         parts = [int(p) for p in parts]
@@ -176,31 +245,52 @@ def _truncate(text: str | None, limit: int = 300) -> str:
     t = text.strip()
     return t if len(t) <= limit else (t[:limit - 1] + "…")
 
-def _derive_suno_url(track: dict) -> str | None:
-    """
-    Prefer explicit 'suno_url', else derive from known Suno CDN or local cache paths.
-    """
-    if track.get("suno_url"):
-        return track["suno_url"]
-
-    url = (track.get("url") or "").strip()
+_SUNO_ID_RE = re.compile(r"/([a-f0-9\-]{8,})\.mp3", re.I)
+_SONG_PAGE_ID_RE = re.compile(r"/song/([A-Za-z0-9\-]{8,})")
+_HEX_ID_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+def _mp3_id(url: str) -> str | None:
+    """Id from '.../{id}.mp3'; plain string ops for the usual shape, regex for anything odder."""
+    if url.endswith(".mp3"):
+        head, sep, name = url.rpartition("/")
+        stem = name[:-4]
+        if sep and len(stem) >= 8 and _HEX_ID_CHARS.issuperset(stem):
+            return stem
+    m = _SUNO_ID_RE.search(url)
+    return m.group(1) if m else None
+
+@functools.lru_cache(maxsize=2048)
+def _esc(s: str) -> str:
+    """escape_markdown, memoized; titles/artists repeat across every re-render."""
+    return escape_markdown(s)
+
+@functools.lru_cache(maxsize=2048)
+def _derive_suno_url_from_url(url: str, page: str | None) -> str | None:
     # songs/{id}.mp3
     if url.startswith("songs/") and url.endswith(".mp3"):
         song_id = url[6:-4]
         return f"https://suno.com/song/{song_id}"
 
     # cdn1.suno.ai/.../{id}.mp3
-    m = re.search(r"/([a-f0-9\-]{8,})\.mp3", url, re.I)
-    if m:
-        return f"https://suno.com/song/{m.group(1)}"
+    song_id = _mp3_id(url)
+    if song_id:
+        return f"https://suno.com/song/{song_id}"
 
     # if track had a page url cached elsewhere
-    page = track.get("page") or track.get("page_url")
     if page and "suno.com" in page:
         return page
 
     return None
 
+def _derive_suno_url(track: dict) -> str | None:
+    """
+    Prefer explicit 'suno_url', else derive from known Suno CDN or local cache paths.
+    """
+    if track.get("suno_url"):
+        return track["suno_url"]
+    url = (track.get("url") or "").strip()
+    return _derive_suno_url_from_url(url, track.get("page") or track.get("page_url"))
+
 def _canonical_track_id(track: dict) -> str | None:
     # 1) explicit id if you already stash one
     if track.get("id"):
@@ -208,32 +298,68 @@ def _canonical_track_id(track: dict) -> str | None:
 
     # 2) try the Suno page URL
     page = _derive_suno_url(track) or (track.get("url") or "")
-    m = re.search(r"/song/([A-Za-z0-9\-]{8,})", page)
+    m = _SONG_PAGE_ID_RE.search(page)
     if m:
         return m.group(1)
 
     # 3) audio filename .../{id}.mp3 (including "songs/{id}.mp3")
     url = str(track.get("url") or "")
-    m = re.search(r"/([A-Fa-f0-9\-]{8,})\.mp3", url)
-    if m:
-        return m.group(1)
+    song_id = _mp3_id(url)
+    if song_id:
+        return song_id
     if url.startswith("songs/") and url.endswith(".mp3"):
         return Path(url).stem
 
     return None
 
-def _track_title_link(track: dict) -> str:
-    title = escape_markdown((track.get("title") or "Untitled").strip())
-    link  = _derive_suno_url(track) or (track.get("url") or "").strip()
+# key -> Future of an extract_song_info call already running in some worker thread
+_EXTRACT_INFLIGHT: dict[str, concurrent.futures.Future] = {}
+_EXTRACT_INFLIGHT_LOCK = threading.Lock()
+
+def _extract_cached(item: dict) -> dict | None:
+    """
+    Blocking: metadata for a track via the song-id cache, falling back to
+    extract_song_info (and caching the result). Run it in a worker thread.
+    Concurrent misses for the same song share one extractor call.
+    """
+    song_id = _canonical_track_id(item)
+    info = get_meta(song_id) if song_id else None
+    if info is not None:
+        return info
+    url = item.get("url") or item.get("suno_url") or ""
+    key = song_id or url
+    with _EXTRACT_INFLIGHT_LOCK:
+        fut = _EXTRACT_INFLIGHT.get(key)
+        leader = fut is None
+        if leader:
+            fut = _EXTRACT_INFLIGHT[key] = concurrent.futures.Future()
+    if not leader:
+        shared = fut.result()  # re-raises the leader's error
+        return dict(shared) if shared else shared  # callers mutate their track dict
+    try:
+        info = extract_song_info(url)
+        if info and song_id:
+            put_meta(song_id, info)
+        fut.set_result(info)
+        return info
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _EXTRACT_INFLIGHT_LOCK:
+            _EXTRACT_INFLIGHT.pop(key, None)
+
+@functools.lru_cache(maxsize=2048)
+def _title_link_md(title_raw: str, link: str) -> str:
+    title = _esc(title_raw.strip())
     # Only link if it's a Suno/page URL; avoid deep linking raw audio if ugly
     if link and ("suno.com" in link):
         return f"[**{title}**]({link})"
     return f"**{title}**"
 
-def _artist_line(track: dict) -> str:
-    # Back-compat if older entries still store 'author'
-    artist = (track.get("artist") or track.get("author") or "Unknown").strip()
-    return f"*by {escape_markdown(artist)}*"
+def _track_title_link(track: dict) -> str:
+    link = _derive_suno_url(track) or (track.get("url") or "").strip()
+    return _title_link_md(track.get("title") or "Untitled", link)
 
 def _filler_badge(track: dict) -> str:
     """
@@ -249,23 +375,98 @@ def _prompt_text(track: dict) -> str:
 def _thumb(track: dict) -> str | None:
     return track.get("thumbnail") or track.get("thumb") or track.get("image")
 
-def _video_url(track: dict) -> str | None:
-    return track.get("video_url") or track.get("video")
+@functools.lru_cache(maxsize=256)
+def _deny_user_cap_dict(requester_mention: str | None, cap: int) -> dict:
+    """Per-user cap rejection embed as a dict; cached since over-cap users tend to retry."""
+    who = requester_mention or "You"
+    return {
+        "title": "🚫 Per-User Queue Limit",
+        "description": f"{who} already {'have' if requester_mention else 'has'} **{cap}** song(s) in the queue. "
+                       f"Please wait until one finishes before adding more.",
+        "color": 0xe74c3c,
+    }
+
+@functools.lru_cache(maxsize=64)
+def _queue_limit_toggle_dict(enabled: bool, maxn: int, per_user_cap: int) -> dict:
+    """!queue_limit_on/off reply payload; only varies with the guild's settings."""
+    if enabled:
+        return {"title": "📦 Queue Limit", "description": f"Queue limit is **ON** (max {maxn} per add).", "color": 0x2ecc71}
+    return {"title": "📦 Queue Limit", "description": f"Queue limit is **OFF**.\nPer-user cap: **{per_user_cap}**", "color": 0xe67e22}
+
+@functools.lru_cache(maxsize=64)
+def _queue_limit_set_dict(enabled: bool, maxn: int, per_user_cap: int) -> dict:
+    """!queue_limit_set reply payload."""
+    return {
+        "title": "📦 Queue Limit",
+        "description": f"Max songs per add set to **{maxn}**.\nPer-user cap: **{per_user_cap}**",
+        "color": 0x3498db,
+    }
+
+@functools.lru_cache(maxsize=64)
+def _queue_limit_status_dict(enabled: bool, maxn: int, per_user_cap: int) -> dict:
+    return {
+        "title": "ℹ️ Queue Limit Status",
+        "description": f"**State:** {'ON' if enabled else 'OFF'}\n"
+                       f"**Max per add:** {maxn}\n"
+                       f"**Max per user:** {per_user_cap}",
+        "color": 0x7289DA,
+    }
+
+def _requester_mention(t: dict) -> str:
+    return (t.get("requester_mention")
+            or (f"<@{t['requester_id']}>" if t.get("requester_id") else None)
+            or t.get("requester_tag")
+            or t.get("requester_name")
+            or "someone")
+
+def _requester_fields(member, requested_at: int) -> dict:
+    """Requester keys for a track; build once per add and dict.update() each song."""
+    return {
+        "requester_id": member.id,
+        "requester_tag": str(member),
+        "requester_name": member.display_name,
+        "requester_mention": member.mention,
+        "requested_at": requested_at,
+    }
+
+# every track key _render_parts reads; the cached strings are reused only while these are unchanged
+_RENDER_SRC_KEYS = (
+    "title", "url", "suno_url", "page", "page_url", "_autofill",
+    "artist", "author", "duration", "thumbnail", "thumb", "image", "video_url", "video",
+    "requester_mention", "requester_id", "requester_tag", "requester_name",
+)
+
+def _render_parts(t: dict) -> dict:
+    """
+    Pre-formatted display strings for a queued track, computed once and kept on
+    the track as `_render` so Now Playing refreshes only join strings.
+    The cache is keyed on the source fields, so edits to a queued track re-render it.
+    `_render` is in-memory only: persistence strips it on save and load.
+    """
+    key = tuple(map(t.get, _RENDER_SRC_KEYS))
+    cached = t.get("_render")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    # Back-compat if older entries still store 'author'
+    artist = (t.get("artist") or t.get("author") or "Unknown").strip()
+    r = {
+        "title_md": _track_title_link(t) + _filler_badge(t),
+        "byline": f"*by {_esc(artist)}*",
+        "requester": _requester_mention(t),
+        "duration": _fmt_duration(t.get("duration")),
+        "thumb": _thumb(t),
+        "video": t.get("video_url") or t.get("video"),
+    }
+    t["_render"] = (key, r)
+    return r
 
 def _format_upcoming_list(tracks: list[dict], limit: int = 2) -> str:
     if not tracks:
         return "—"
     lines = []
     for i, t in enumerate(tracks[:limit], start=1):
-        title = _track_title_link(t) + _filler_badge(t)  # ⬅️ add badge
-        artist = (t.get("artist") or t.get("author") or "Unknown").strip()
-        byline = f"*by {escape_markdown(artist)}*"
-        requester = (t.get("requester_mention")
-                     or (f"<@{t['requester_id']}>" if t.get("requester_id") else None)
-                     or t.get("requester_tag")
-                     or t.get("requester_name")
-                     or "someone")
-        lines.append(f"{i}. {title} {byline} / Requested by {requester}")
+        r = _render_parts(t)
+        lines.append(f"{i}. {r['title_md']} {r['byline']} / Requested by {r['requester']}")
     return "\n".join(lines)
 
 def _join_info_blocks(prompt: str | None, lyrics: str | None) -> str:
@@ -278,45 +479,54 @@ def _join_info_blocks(prompt: str | None, lyrics: str | None) -> str:
         parts.append(lyrics.strip())
     return "\n".join(parts).strip() or "*No prompt/lyrics available for this track.*"
 
-def _chunk_text(s: str | None, limit: int = 3900) -> list[str]:
-    """Split long text into Discord-safe chunks, preferring paragraph/line breaks."""
+_PARA_BREAK_RE = re.compile(r"(?=\n\n)")
+_LINE_BREAK_RE = re.compile(r"(?=\n)")
+
+def _last_break_at_or_before(breaks: list[int], lo: int, hi: int) -> int:
+    """Largest position in sorted `breaks` within [lo, hi], or -1."""
+    i = bisect.bisect_right(breaks, hi) - 1
+    return breaks[i] if i >= 0 and breaks[i] >= lo else -1
+
+def _iter_chunks(s: str | None, limit: int = 3900) -> Iterator[str]:
+    """Yield Discord-safe chunks lazily, preferring paragraph/line breaks."""
     if not s:
-        return []
+        return
     s = s.strip()
     if len(s) <= limit:
-        return [s]
+        yield s
+        return
 
-    out: list[str] = []
-    remaining = s
-    while len(remaining) > limit:
-        # try paragraph break
-        cut = remaining.rfind("\n\n", 0, limit)
+    # break positions are collected once; each chunk is then a bisect, not a rescan
+    paras = [m.start() for m in _PARA_BREAK_RE.finditer(s)]
+    lines = [m.start() for m in _LINE_BREAK_RE.finditer(s)]
+
+    start, end = 0, len(s)
+    while end - start > limit:
+        # try paragraph break, then single line break, then hard cut
+        cut = _last_break_at_or_before(paras, start, start + limit - 2)
         if cut == -1:
-            # try single line break
-            cut = remaining.rfind("\n", 0, limit)
+            cut = _last_break_at_or_before(lines, start, start + limit - 1)
         if cut == -1:
-            # hard cut
-            cut = limit
-        out.append(remaining[:cut].rstrip())
-        remaining = remaining[cut:].lstrip()
-    if remaining:
-        out.append(remaining)
-    return out
+            cut = start + limit
+        yield s[start:cut].rstrip()
+        start = cut
+        while start < end and s[start].isspace():
+            start += 1
+    if start < end:
+        yield s[start:]
 
 def build_now_playing_embed(track: dict, requester_mention: str | None, upcoming_tracks: list[dict] | None = None):
-    desc = [
-        _track_title_link(track) + _filler_badge(track),
-        _artist_line(track),
-        ""
-    ]
+    r = _render_parts(track)  # title link + badge and byline, computed once per track
+    desc = [r["title_md"], r["byline"], ""]
     embed = discord.Embed(
         title="🎵 Now Playing",
         description="\n".join(desc),
         color=EMBED_COLOR_PLAYING
     )
-    embed.add_field(name="Duration", value=_fmt_duration(track.get("duration")), inline=True)
+    embed.add_field(name="Duration", value=r["duration"], inline=True)
 
-    ts = int(track.get("requested_at") or datetime.datetime.now(datetime.timezone.utc).timestamp())
+    now = datetime.datetime.now(_UTC)  # one clock read for both the fallback and the footer
+    ts = int(track.get("requested_at") or now.timestamp())
     req_val = (requester_mention or "—") + f" at <t:{ts}:t>"
     embed.add_field(name="Requested by", value=req_val, inline=True)
 
@@ -327,17 +537,17 @@ def build_now_playing_embed(track: dict, requester_mention: str | None, upcoming
             inline=False
         )
 
-    thumb = _thumb(track)
+    thumb = r["thumb"]
     if thumb:
         embed.set_thumbnail(url=thumb)
 
-    video = _video_url(track)
+    video = r["video"]
     if video:
         # Try using set_image for video - Discord may display it as a video preview
         embed.set_image(url=video)
 
     embed.set_footer(text="Suno Radio")
-    embed.timestamp = datetime.datetime.now(datetime.timezone.utc)
+    embed.timestamp = now
     return embed
 
 def build_added_embed(
@@ -351,19 +561,16 @@ def build_added_embed(
     Added card: heading = song title (clickable), body = artist,
     fields = Duration, Requested by (with original request time), Position (+ ETA).
     """
-    desc = [
-        _track_title_link(track) + _filler_badge(track),
-        _artist_line(track),
-        ""
-    ]
+    r = _render_parts(track)  # title link + badge and byline, computed once per track
+    desc = [r["title_md"], r["byline"], ""]
     embed = discord.Embed(
         title="➕ Added",
         description="\n".join([s for s in desc if s is not None]),
         color=EMBED_COLOR_ADDED
     )
-    embed.add_field(name="Duration", value=_fmt_duration(track.get("duration")), inline=True)
+    embed.add_field(name="Duration", value=r["duration"], inline=True)
 
-    ts = int(track.get("requested_at") or datetime.datetime.now(datetime.timezone.utc).timestamp())
+    ts = int(track.get("requested_at") or time.time())
     req_val = (requester_mention or "—") + f" at <t:{ts}:t>"
     embed.add_field(name="Requested by", value=req_val, inline=True)
 
@@ -377,7 +584,7 @@ def build_added_embed(
         pos_val = f"#{position}" + (f" (Up in ~{eta_label})" if eta_label else "")
         embed.add_field(name="Position", value=pos_val, inline=False)
 
-    thumb = _thumb(track)
+    thumb = r["thumb"]
     if thumb:
         embed.set_thumbnail(url=thumb)
 
@@ -387,11 +594,11 @@ def build_added_embed(
 def _render_song_header(song: dict) -> str:
     # Reuse existing helpers for safety/consistency
     title_raw = (song.get("title") or "Unknown Title").strip()
-    title = escape_markdown(title_raw)
+    title = _esc(title_raw)
     link  = _derive_suno_url(song) or (song.get("url") or "").strip()
 
     artist_raw = (song.get("artist") or song.get("author") or "Unknown Artist").strip()
-    artist = escape_markdown(artist_raw)
+    artist = _esc(artist_raw)
 
     # Only link if Suno/page URL; avoid raw audio deep links
     if link and ("suno.com" in link):
@@ -444,6 +651,26 @@ def _render_prompt_lyrics_block(song: dict) -> str:
 
     return "\n".join(parts).strip()
 
+_SONG_INFO_FIELD_CAP = 23      # Discord allows 25; keep slots for Duration etc.
+_SONG_INFO_CHAR_BUDGET = 5800  # Discord caps an embed at 6000 chars total
+
+_TRUNCATED_NOTE = "… _(truncated — open the song on Suno for the full text)_"
+_TRUNCATED_ROOM = len(_TRUNCATED_NOTE) + 12  # marker value + a short field name
+
+def _embed_has_room(embed: discord.Embed, value: str, reserve_fields: int = 0, reserve_chars: int = 0) -> bool:
+    return (len(embed.fields) + reserve_fields < _SONG_INFO_FIELD_CAP
+            and len(embed) + len(value) + 12 + reserve_chars <= _SONG_INFO_CHAR_BUDGET)
+
+def _add_chunked_fields(embed: discord.Embed, name: str, text: str,
+                        reserve_fields: int = 0, reserve_chars: int = 0) -> None:
+    """Add `text` as chunked fields under `name`; if the embed fills up, end with a visible truncation marker."""
+    for i, chunk in enumerate(_iter_chunks(text, limit=1020)):  # field value limit is 1024
+        # always keep room for the marker itself, plus whatever the caller reserved
+        if not _embed_has_room(embed, chunk, reserve_fields + 1, reserve_chars + _TRUNCATED_ROOM):
+            embed.add_field(name=name if i == 0 else "", value=_TRUNCATED_NOTE, inline=False)
+            return
+        embed.add_field(name=name if i == 0 else "", value=chunk, inline=False)
+
 def build_song_info_embed(song: dict) -> discord.Embed:
     """
     Build the song info embed (same as song_info command).
@@ -481,24 +708,13 @@ def build_song_info_embed(song: dict) -> discord.Embed:
         lyrics = (song.get("lyrics") or "").strip()
         
         if prompt:
-            prompt_chunks = _chunk_text(prompt, limit=1020)  # Field value limit is 1024
-            for i, chunk in enumerate(prompt_chunks):
-                embed.add_field(
-                    name="**Prompt**" if i == 0 else f"",
-                    value=chunk,
-                    inline=False
-                )
+            # leave one field for the Lyrics header (or its truncation marker)
+            _add_chunked_fields(embed, "**Prompt**", prompt, reserve_fields=1, reserve_chars=_TRUNCATED_ROOM)
         else:
             embed.add_field(name="**Prompt**", value="_No prompt provided._", inline=False)
         
         if lyrics:
-            lyrics_chunks = _chunk_text(lyrics, limit=1020)
-            for i, chunk in enumerate(lyrics_chunks):
-                embed.add_field(
-                    name="**Lyrics**" if i == 0 else f"",
-                    value=chunk,
-                    inline=False
-                )
+            _add_chunked_fields(embed, "**Lyrics**", lyrics)
         else:
             embed.add_field(name="**Lyrics**", value="_No lyrics provided._", inline=False)
     
@@ -513,7 +729,7 @@ def build_song_info_embed(song: dict) -> discord.Embed:
         embed.set_thumbnail(url=thumb)
     
     embed.set_footer(text="Suno Radio")
-    embed.timestamp = datetime.datetime.now(datetime.timezone.utc)
+    embed.timestamp = datetime.datetime.now(_UTC)
     return embed
 
 # ---------------------------------------------------------------------------
@@ -522,6 +738,57 @@ LIKE_EMOJI_NAME = "sunobotlike"
 LIKE_EMOJI_ID   = 1437172794499534930
 LIKE_FALLBACK   = "👍"
 
+LIKE_COUNT_TTL_SEC = 30.0
+_like_count_cache: dict[tuple[str, int], tuple[int, float]] = {}  # (track_id, guild_id) -> (count, expires_at)
+
+def _cached_like_count(track_id: str, guild_id: int) -> int:
+    """get_like_count with a short TTL so repeat NP/Added cards skip the DB."""
+    key = (track_id, guild_id)
+    hit = _like_count_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    try:
+        count = get_like_count(track_id=track_id, guild_id=guild_id)
+    except Exception:
+        return 0
+    _like_count_cache[key] = (count, now + LIKE_COUNT_TTL_SEC)
+    if len(_like_count_cache) > 1024:  # drop expired entries once it grows
+        for k in [k for k, (_, exp) in _like_count_cache.items() if exp <= now]:
+            del _like_count_cache[k]
+    return count
+
+def _remember_like_count(track_id: str, guild_id: int, count) -> None:
+    if isinstance(count, int):
+        _like_count_cache[(track_id, guild_id)] = (count, time.monotonic() + LIKE_COUNT_TTL_SEC)
+
+def _apply_like_click(*, track_id: str, guild_id: int, user_id: int, username: str, repeat: bool) -> tuple[str, int, int]:
+    """
+    Blocking DB work for one like-button press; run it via asyncio.to_thread.
+    A repeat press in the same view toggles (unlikes if the user has likes).
+    Returns (action, total likes, this user's likes); action is "unliked", "liked" or "again".
+    """
+    existing = get_user_like_count(track_id=track_id, guild_id=guild_id, user_id=user_id)
+    if repeat and existing > 0:
+        total = unlike_track(track_id=track_id, guild_id=guild_id, user_id=user_id)
+        action = "unliked"
+    else:
+        total = like_track(track_id=track_id, guild_id=guild_id, user_id=user_id, username=username)
+        action = "again" if (not repeat and existing > 0) else "liked"
+    user_count = get_user_like_count(track_id=track_id, guild_id=guild_id, user_id=user_id)
+    return action, total, user_count
+
+def _like_click_message(action: str, title: str, user_count: int, verb: str = "liked") -> str:
+    if action == "unliked":
+        if user_count == 0:
+            return f"Removed your like for **{title}**."
+        return f"Removed a like for **{title}**. (You still have {user_count} like{'s' if user_count != 1 else ''})"
+    if action == "again":
+        return f"Saved to Autofill **{title}** again! (You've {verb} this {user_count} times)"
+    if user_count > 1:
+        return f"Saved to Autofill **{title}**! (You've {verb} this {user_count} times)"
+    return f"Saved to Autofill **{title}**!"
+
 class LikeView(discord.ui.View):
     def __init__(
         self,
@@ -544,10 +811,8 @@ class LikeView(discord.ui.View):
         # Track which users have clicked in this view instance
         self.user_clicked = set()
 
-        try:
-            count = get_like_count(track_id=track_id, guild_id=guild_id)
-        except Exception:
-            count = 0
+        # only the debug count label needs the total; the default label doesn't touch the DB
+        count = _cached_like_count(track_id, guild_id) if show_count else 0
 
         # Set emoji (separate from label)
         try:
@@ -572,69 +837,15 @@ class LikeView(discord.ui.View):
 
         try:
             user_id = interaction.user.id
-            has_clicked_before = user_id in self.user_clicked
-            
-            # Check if user has existing likes for this track
-            existing_user_likes = get_user_like_count(
-                track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
+            action, total, user_count = await asyncio.to_thread(
+                _apply_like_click,
+                track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
+                username=str(interaction.user), repeat=user_id in self.user_clicked,
             )
-            
-            if has_clicked_before:
-                # On subsequent clicks in the same view: toggle like/unlike
-                if existing_user_likes > 0:
-                    # User has likes, so unlike (remove one like)
-                    total = unlike_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count == 0:
-                        msg = f"Removed your like for **{self.song_title}**."
-                    else:
-                        msg = f"Removed a like for **{self.song_title}**. (You still have {user_count} like{'s' if user_count != 1 else ''})"
-                else:
-                    # User has no likes, so like it
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count > 1:
-                        msg = f"Saved to Autofill **{self.song_title}**! (You've liked this {user_count} times)"
-                    else:
-                        msg = f"Saved to Autofill **{self.song_title}**!"
-            else:
-                # First click in this view
-                if existing_user_likes > 0:
-                    # User already has likes, so add another like
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    msg = f"Saved to Autofill **{self.song_title}** again! (You've liked this {user_count} times)"
-                else:
-                    # User has no likes, so like it
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count > 1:
-                        msg = f"Saved to Autofill **{self.song_title}**! (You've liked this {user_count} times)"
-                    else:
-                        msg = f"Saved to Autofill **{self.song_title}**!"
-                
-                # Mark that this user has clicked in this view
-                self.user_clicked.add(user_id)
-            
+            msg = _like_click_message(action, self.song_title, user_count)
+            self.user_clicked.add(user_id)
+
+            _remember_like_count(self.track_id, self.guild_id, total)
             button.label = str(total) if self.show_count else "Save for Autofill"
 
             await interaction.response.edit_message(view=self)
@@ -714,69 +925,15 @@ class LikeButton(discord.ui.Button):
         
         try:
             user_id = interaction.user.id
-            has_clicked_before = user_id in self.view_instance.user_clicked
-            
-            # Check if user has existing likes for this track
-            existing_user_likes = get_user_like_count(
-                track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
+            action, total, user_count = await asyncio.to_thread(
+                _apply_like_click,
+                track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
+                username=str(interaction.user), repeat=user_id in self.view_instance.user_clicked,
             )
-            
-            if has_clicked_before:
-                # On subsequent clicks in the same view: toggle like/unlike
-                if existing_user_likes > 0:
-                    # User has likes, so unlike (remove one like)
-                    total = unlike_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count == 0:
-                        msg = f"Removed your like for **{self.song_title}**."
-                    else:
-                        msg = f"Removed a like for **{self.song_title}**. (You still have {user_count} like{'s' if user_count != 1 else ''})"
-                else:
-                    # User has no likes, so like it
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count > 1:
-                        msg = f"Saved to Autofill **{self.song_title}**! (You've added this {user_count} times)"
-                    else:
-                        msg = f"Saved to Autofill **{self.song_title}**!"
-            else:
-                # First click in this view
-                if existing_user_likes > 0:
-                    # User already has likes, so add another like
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    msg = f"Saved to Autofill **{self.song_title}** again! (You've added this {user_count} times)"
-                else:
-                    # User has no likes, so like it
-                    total = like_track(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id,
-                        username=str(interaction.user),
-                    )
-                    user_count = get_user_like_count(
-                        track_id=self.track_id, guild_id=self.guild_id, user_id=user_id
-                    )
-                    if user_count > 1:
-                        msg = f"Saved to Autofill **{self.song_title}**! (You've added this {user_count} times)"
-                    else:
-                        msg = f"Saved to Autofill **{self.song_title}**!"
-                
-                # Mark that this user has clicked in this view
-                self.view_instance.user_clicked.add(user_id)
-            
+            msg = _like_click_message(action, self.song_title, user_count, verb="added")
+            self.view_instance.user_clicked.add(user_id)
+            _remember_like_count(self.track_id, self.guild_id, total)
+
             self.label = "Save for Autofill"
             
             await interaction.response.edit_message(view=self.view_instance)
@@ -839,13 +996,17 @@ class NowPlayingView(discord.ui.View):
 class RadioBot(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.queues = defaultdict(deque)
-        self.playlists = defaultdict(lambda: defaultdict(deque))
+        self.queues = defaultdict(TrackQueue)
+        self.playlists: dict[int, dict[str, deque]] = {}  # only created when a guild has playlists
         self.user_mappings = defaultdict(dict)
         self.volumes = defaultdict(lambda: float(os.getenv("DEFAULT_VOLUME", "1.0")))
         self.current_song = None
         self.song_start_time = None
         self.activity_task = None
+        self._last_presence_name = None
+        self._last_presence_ts = 0.0       # time.monotonic() of the last change_presence
+        self._presence_pending = None      # newest activity name held back by the rate limit
+        self._presence_flush_task = None
         self.auto_play_enabled = {}
         self.auto_play_tasks = {}
         self.auto_playlist_urls = {}
@@ -859,15 +1020,140 @@ class RadioBot(commands.Cog):
 
         # --- Playback overlap guard (fixes double-play jitter) -----------------
         self._play_locks = defaultdict(asyncio.Lock)
+        self._autofill_locks = defaultdict(asyncio.Lock)
 
         # --- Now Playing tracking for pruning (autofill only) -----------------
         self._song_index = defaultdict(int)
         self._np_track = defaultdict(list)
         self._np_retention_n = REMOVE_NP_AFTER_SONGS
+        self._np_send_locks = defaultdict(asyncio.Lock)  # channel_id -> Lock
+        self._np_last_sent = {}  # channel_id -> time.monotonic() of last NP card
+        self._embed_inflight: set[int] = set()   # channels with a coalesced send in progress
+        self._liked_rows_cache: dict[tuple[int, frozenset], tuple[float, list[dict]]] = {}  # (gid, listeners) -> (monotonic, rows)
+        self._pending_embeds: dict[int, discord.Embed] = {}  # channel_id -> newest embed waiting
 
         # --- QPanel message tracking (for cleanup) -----------------------------
         self._qpanel_messages = {}  # guild_id -> discord.Message
 
+        # --- Coalesced persistence (see _saver_loop) ---------------------------
+        self._dirty_guilds: set[int] = set()
+        self._dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()  # one drain+write at a time, so snapshots land in order
+        self._saver_task = None
+
+        # --- Background prefetch of upcoming tracks ----------------------------
+        self._prefetch_sem = asyncio.Semaphore(max(1, PREFETCH_CONCURRENCY))
+        self._prefetch_tasks = {}  # id(song dict) -> asyncio.Task
+
+        # --- Shared pool for extract_song_info (kept warm across batches) -----
+        self._resolver_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, RESOLVER_WORKERS), thread_name_prefix="resolver"
+        )
+        self._scrape_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, SCRAPE_POOL_SIZE), thread_name_prefix="suno-scrape"
+        )
+        self._io_exec = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, IO_POOL_SIZE), thread_name_prefix="suno-io"
+        )
+        # one user spamming !play/!playlist can't monopolize the pools above
+        self._user_fetch_sem = defaultdict(lambda: asyncio.Semaphore(max(1, USER_FETCH_CONCURRENCY)))
+
+    def _mark_dirty(self, gid: int) -> None:
+        """Schedule a save for this guild; the saver loop batches bursts."""
+        self._dirty_guilds.add(gid)
+        self._dirty.set()
+
+    def _drain_dirty(self) -> list[tuple[int, dict]]:
+        """Snapshot pending guilds on the loop so the writer never sees live deques."""
+        gids, self._dirty_guilds = self._dirty_guilds, set()
+        self._dirty.clear()
+        if not gids:
+            return []
+        data = snapshot_data(self.queues, self.playlists, self.user_mappings)
+        return [(gid, data) for gid in gids]
+
+    @staticmethod
+    def _write_snapshots(jobs: list[tuple[int, dict]]) -> list[int]:
+        """Runs in a worker thread. Returns the guild ids that failed to write."""
+        failed = []
+        for gid, data in jobs:
+            try:
+                write_data(gid, data)
+            except Exception as e:
+                print(f"[persist] save failed for guild {gid}: {e}")
+                failed.append(gid)
+        return failed
+
+    async def _saver_loop(self):
+        delay = SAVE_DEBOUNCE_SEC
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(delay)
+            if await self._flush_saves():
+                delay = min(60.0, max(1.0, delay * 2))  # disk trouble: back off between retries
+            else:
+                delay = SAVE_DEBOUNCE_SEC
+
+    async def _flush_saves(self) -> list[int]:
+        """
+        Write any pending guilds now. Snapshot and write happen under _save_lock,
+        so a newer snapshot is never overtaken on disk by an older one.
+        Returns the guild ids that failed; they stay dirty and the saver retries.
+        """
+        async with self._save_lock:
+            jobs = self._drain_dirty()
+            if not jobs:
+                return []
+            failed = await asyncio.get_running_loop().run_in_executor(
+                self._scrape_pool, self._write_snapshots, jobs
+            )
+            if failed:
+                self._dirty_guilds.update(failed)
+                self._dirty.set()
+            return failed
+
+    @staticmethod
+    def _cleanup_prefetch(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Prefetch cleanup failed: {path}: {e}")
+
+    async def _save(self, gid: int) -> None:
+        """Write one guild right away through the shared saver (waits for any write in flight)."""
+        self._mark_dirty(gid)
+        await self._flush_saves()
+
+    async def _bounded_prefetch(self, song: dict) -> None:
+        async with self._prefetch_sem:
+            try:
+                await maybe_prefetch(song, self._io_exec)
+            except Exception as e:
+                print(f"[prefetch] background prefetch failed for {song.get('url')}: {e}")
+
+    def _schedule_prefetch(self, tracks) -> None:
+        """Fire-and-forget prefetch for the given tracks, capped by PREFETCH_CONCURRENCY."""
+        if PREFETCH_MODE not in ("warmup", "full"):
+            return
+        for t in tracks:
+            key = id(t)
+            if key in self._prefetch_tasks:
+                continue
+            task = asyncio.create_task(self._bounded_prefetch(t))
+            self._prefetch_tasks[key] = task
+            task.add_done_callback(lambda _t, k=key: self._prefetch_tasks.pop(k, None))
+
+    async def _await_prefetch(self, song: dict) -> None:
+        """If a background prefetch for this song is in flight, let it finish first."""
+        task = self._prefetch_tasks.get(id(song))
+        if task is not None and not task.done():
+            try:
+                await asyncio.shield(task)
+            except Exception:
+                pass
+
     def _is_admin(self, member: discord.Member) -> bool:
         """Admins bypass queue limitations."""
         try:
@@ -965,7 +1251,7 @@ class RadioBot(commands.Cog):
             return None, f"Invalid position."
         q = self.queues[gid]
         if 0 <= idx < len(q):
-            return list(q)[idx], f"Queued song #{idx+1}"
+            return q[idx], f"Queued song #{idx+1}"
         return None, f"Invalid position. Must be between 1 and {len(q)}."
 
     def _estimate_eta_seconds(self, gid: int, position: int) -> tuple[int | None, bool]:
@@ -982,9 +1268,8 @@ class RadioBot(commands.Cog):
                 eta += max(0, cur_dur - elapsed)
                 had_known = True
 
-        q = self.queues.get(gid, deque())
-        ahead = list(q)[:max(0, position - 1)]
-        for t in ahead:
+        q = self.queues.get(gid) or ()
+        for t in itertools.islice(q, max(0, position - 1)):
             td = _duration_to_seconds(t.get("duration"))
             if td is None:
                 had_unknown = True
@@ -1000,13 +1285,9 @@ class RadioBot(commands.Cog):
         q = self.queues[gid]
         if not q:
             return 0
-        n = 0
-        for t in q:
-            if (not include_filler) and t.get("_autofill"):
-                continue
-            if t.get("requester_id") == user_id:
-                n += 1
-        return n
+        if not include_filler:
+            return q.user_counts[user_id]  # kept in step by TrackQueue
+        return sum(1 for t in q if t.get("requester_id") == user_id)
 
     def _user_slots_remaining(self, gid: int, user_id: int) -> int:
         have = self._count_user_queued(gid, user_id, include_filler=False)
@@ -1047,16 +1328,12 @@ class RadioBot(commands.Cog):
 
     def _deny_user_cap_embed(self, requester_mention: str | None = None, gid: int | None = None) -> discord.Embed:
         cap = self._per_user_max(gid) if gid is not None else QUEUE_MAX_PER_USER
-        who = requester_mention or "You"
-        return discord.Embed(
-            title="🚫 Per-User Queue Limit",
-            description=f"{who} already {'have' if requester_mention else 'has'} **{cap}** song(s) in the queue. "
-                        f"Please wait until one finishes before adding more.",
-            color=0xe74c3c
-        )
+        return discord.Embed.from_dict(_deny_user_cap_dict(requester_mention, cap))
 
-    def _queue_eta_list(self, gid: int) -> list[int | None]:
-        etas: list[int | None] = []
+    def _queue_eta_list(self, gid: int, limit: int | None = None) -> list[int | None]:
+        """ETA per queued track; only the first `limit` entries when given."""
+        q = self.queues.get(gid) or ()
+        n = len(q) if limit is None else min(len(q), max(0, limit))
         base = 0
         if self.current_song and self.song_start_time:
             cur = _duration_to_seconds(self.current_song.get("duration"))
@@ -1064,21 +1341,27 @@ class RadioBot(commands.Cog):
                 elapsed = int(max(0, time.time() - self.song_start_time))
                 base = max(0, cur - elapsed)
             else:
-                return [None for _ in range(len(self.queues.get(gid, [])))]
-
-        acc = base
-        q = list(self.queues.get(gid, []))
-        for t in q:
-            etas.append(acc if acc is not None else None)
-            d = _duration_to_seconds(t.get("duration"))
-            if d is None:
-                acc = None
-            else:
-                if acc is not None:
-                    acc += d
+                return [None] * n
+
+        durs = [_duration_to_seconds(t.get("duration")) for t in itertools.islice(q, n)]
+        # prefix sums up to the first unknown duration; everything after it is unknown too
+        try:
+            known = durs.index(None)
+        except ValueError:
+            known = n
+        etas: list[int | None] = list(itertools.accumulate(durs[:known], initial=base))[:n]
+        etas.extend([None] * (n - len(etas)))
         return etas
 
     # ===== AUTOFILL (Idle Radio) ============================================
+    def _get_autofill_cfg(self, gid: int) -> dict:
+        """The guild's persisted autofill settings; mutate in place, then _mark_dirty."""
+        amap = self.user_mappings[gid]
+        cfg = amap.get("autofill")
+        if not isinstance(cfg, dict):
+            cfg = amap["autofill"] = {}
+        return cfg
+
     def _is_autofill_enabled(self, gid: int) -> bool:
         return (
             self._autofill_feature_on
@@ -1097,18 +1380,53 @@ class RadioBot(commands.Cog):
 
     def _clear_autofill_from_queue(self, gid: int):
         dq = self.queues[gid]
-        if not dq:
+        if not dq or not dq.autofill_count:
             return
-        kept = [t for t in dq if not t.get("_autofill")]
-        dq.clear()
-        dq.extend(kept)
+        # One in-place pass: cycle entries front-to-back dropping filler; once the
+        # last filler is gone, rotate the untouched remainder into place.
+        n = len(dq)
+        for i in range(n):
+            if not dq.autofill_count:
+                dq.rotate(-(n - i))
+                break
+            t = dq.popleft()
+            if not t.get("_autofill"):
+                dq.append(t)
 
     def _load_autofill_csv(self, path: str) -> list[dict]:
+        """
+        Seed rows from an autofill CSV. Parsed rows are shared between guilds
+        and reused until the file's mtime/size changes, so treat them as read-only.
+        """
         rows = []
-        if not path or not os.path.exists(path):
+        if not path:
+            return rows
+        try:
+            st = os.stat(path)
+        except OSError:
             return rows
+        key = os.path.abspath(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CSV_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        rows = self._parse_autofill_csv(path)
+        _CSV_CACHE[key] = (stamp, rows)
+        return rows
+
+    @staticmethod
+    def _parse_autofill_csv(path: str) -> list[dict]:
+        rows = []
         try:
             with open(path, "r", encoding="utf-8-sig", newline="") as f:
+                if AUTOFILL_CSV_SCHEMA == "url,requested_by":
+                    # known layout: no Sniffer pass; a header row, if any, is just url == "url"
+                    for r in csv.DictReader(f, fieldnames=("url", "requested_by")):
+                        url = (r["url"] or "").strip()
+                        if url and url.lower() != "url":
+                            rows.append({"url": url, "requested_by": (r["requested_by"] or "").strip()})
+                    return rows
+
                 sniffer = csv.Sniffer()
                 sample = f.read(2048)
                 f.seek(0)
@@ -1157,15 +1475,27 @@ class RadioBot(commands.Cog):
         if not user_ids:
             return []
 
-        try:
-            rows = top_liked_for_users(
-                guild_id=gid,
-                user_ids=user_ids,
-                limit=AUTOFILL_MAX_PULL * max(1, AUTOFILL_LIKES_PER_USER),
-            )
-        except Exception as e:
-            print(f"[autofill likes] failed to fetch liked tracks: {e}")
-            return []
+        # back-to-back batches with the same listeners reuse the last query
+        key = (gid, frozenset(user_ids))
+        now = time.monotonic()
+        hit = self._liked_rows_cache.get(key)
+        if hit is not None and now - hit[0] < max(1, AUTOFILL_DELAY_SEC):
+            rows = hit[1]
+        else:
+            try:
+                rows = await asyncio.to_thread(
+                    top_liked_for_users,
+                    guild_id=gid,
+                    user_ids=user_ids,
+                    limit=AUTOFILL_MAX_PULL * max(1, AUTOFILL_LIKES_PER_USER),
+                )
+            except Exception as e:
+                print(f"[autofill likes] failed to fetch liked tracks: {e}")
+                return []
+            # one entry per guild is all that's ever useful
+            for k in [k for k in self._liked_rows_cache if k[0] == gid]:
+                del self._liked_rows_cache[k]
+            self._liked_rows_cache[key] = (now, rows)
 
         by_user: dict[int, list[dict]] = defaultdict(list)
         for r in rows:
@@ -1207,75 +1537,95 @@ class RadioBot(commands.Cog):
 
         return raw
 
-    async def _enqueue_autofill_batch(self, ctx, gid: int):
-        liked_raw = await self._get_autofill_liked_raw(ctx, gid)
-        liked_raw = liked_raw[:AUTOFILL_MAX_PULL]
-        remaining = max(0, AUTOFILL_MAX_PULL - len(liked_raw))
-
-        url = (self.auto_playlist_urls.get(gid) or "").strip()
-        fallback_raw: list[dict] = []
-
-        if remaining > 0:
-            if url:
-                raw_from_url = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: scrape_suno_songs(url, limit=AUTOFILL_MAX_PULL)
-                )
-                if raw_from_url:
-                    random.shuffle(raw_from_url)
-                    fallback_raw = raw_from_url[:remaining]
-            else:
-                seed = self.autofill_seed_rows.get(gid) or []
-                if seed:
-                    pick = seed[:]
-                    random.shuffle(pick)
-                    pick = pick[:remaining]
-                    fallback_raw = [
-                        {"url": r["url"], "requested_by_note": r.get("requested_by", "")}
-                        for r in pick
-                    ]
-
-        combined_raw = liked_raw + fallback_raw
-        if not combined_raw:
-            return 0
-
-        cleaned_raw = []
-        for it in combined_raw:
+    @staticmethod
+    def _clean_autofill_raw(items: list[dict]) -> list[dict]:
+        cleaned = []
+        for it in items:
             u = str(it.get("url") or it.get("suno_url") or "").strip()
             if not u:
                 continue
             if not (u.startswith("http://") or u.startswith("https://") or u.startswith("songs/")):
                 continue
             it["url"] = u
-            cleaned_raw.append(it)
+            cleaned.append(it)
+        return cleaned
 
-        if not cleaned_raw:
-            return 0
+    async def _enqueue_autofill_batch(self, ctx, gid: int):
+        # One fill per guild at a time; a second trigger that waited on the
+        # lock finds the queue already filled and backs off.
+        async with self._autofill_locks[gid]:
+            if self.queues.get(gid):
+                return 0
+            return await self._fill_autofill_batch(ctx, gid)
+
+    async def _fill_autofill_batch(self, ctx, gid: int):
+        liked_raw = await self._get_autofill_liked_raw(ctx, gid)
+        liked_raw = self._clean_autofill_raw(liked_raw[:AUTOFILL_MAX_PULL])
+        remaining = max(0, AUTOFILL_MAX_PULL - len(liked_raw))
+
+        # Liked tracks are known up front: start resolving them while the
+        # playlist page is still being scraped rather than after it.
+        liked_job = asyncio.ensure_future(self._resolve_tracks(liked_raw)) if liked_raw else None
 
-        tracks = await self._resolve_tracks(cleaned_raw, max_workers=6)
+        url = (self.auto_playlist_urls.get(gid) or "").strip()
+        fallback_raw: list[dict] = []
+
+        try:
+            if remaining > 0:
+                if url:
+                    raw_from_url = await asyncio.get_running_loop().run_in_executor(
+                        self._scrape_pool, scrape_suno_songs, url, AUTOFILL_MAX_PULL
+                    )
+                    if raw_from_url:
+                        random.shuffle(raw_from_url)
+                        fallback_raw = raw_from_url[:remaining]
+                else:
+                    seed = self.autofill_seed_rows.get(gid) or []
+                    if seed:
+                        pick = seed[:]
+                        random.shuffle(pick)
+                        pick = pick[:remaining]
+                        fallback_raw = [
+                            {"url": r["url"], "requested_by_note": r.get("requested_by", "")}
+                            for r in pick
+                        ]
+            fallback_raw = self._clean_autofill_raw(fallback_raw)
+            tracks = await self._resolve_tracks(fallback_raw) if fallback_raw else []
+        except BaseException:
+            if liked_job is not None:
+                liked_job.cancel()
+            raise
+
+        if liked_job is not None:
+            tracks = list(await liked_job) + list(tracks)
+        if not tracks:
+            return 0
         random.shuffle(tracks)
 
-        now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        now_ts = int(time.time())
+        requester = {
+            "requester_id": self.bot.user.id if self.bot.user else None,
+            "requester_tag": "Autofill",
+            "requester_name": "Autofill",
+            "requester_mention": None,
+            "requested_at": now_ts,
+        }
         for t in tracks:
             t["_autofill"] = True
             t.setdefault("tags", []).append("filler")
+            t.update(requester)
+            _render_parts(t)
+        self.queues[gid].extend(tracks)
 
-            t["requester_id"] = self.bot.user.id if self.bot.user else None
-            t["requester_tag"] = "Autofill"
-            t["requester_name"] = "Autofill"
-            t["requester_mention"] = None
-            t["requested_at"] = now_ts
-
-            self.queues[gid].append(t)
-
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._schedule_prefetch(tracks[:max(0, PREFETCH_AHEAD)])
+        self._mark_dirty(gid)
         return len(tracks)
 
     async def _autofill_after_delay(self, ctx, gid: int, delay: int):
         try:
             await asyncio.sleep(max(0, delay))
-            if self.queues[gid] or self.current_song:
-                return
-            if not self._is_autofill_enabled(gid):
+            # still idle? (.get: don't materialize an empty queue for the guild)
+            if self.queues.get(gid) or self.current_song or not self._is_autofill_enabled(gid):
                 return
 
             added = await self._enqueue_autofill_batch(ctx, gid)
@@ -1301,14 +1651,67 @@ class RadioBot(commands.Cog):
         )
 
     # ===== Queue add limit helpers ==========================================
+    # defaults are parsed to int/bool at import and _set_queue_limit stores
+    # normalized values, so these are plain lookups
     def _limit_is_on(self, gid: int) -> bool:
-        return bool(self.queue_limit_enabled.get(gid, QUEUE_LIMIT_DEFAULT_ENABLED))
+        return self.queue_limit_enabled.get(gid, QUEUE_LIMIT_DEFAULT_ENABLED)
 
     def _limit_max(self, gid: int) -> int:
-        return int(self.queue_limit_max.get(gid, QUEUE_LIMIT_MAX_PER_ADD))
+        return self.queue_limit_max.get(gid, QUEUE_LIMIT_MAX_PER_ADD)
 
     def _per_user_max(self, gid: int) -> int:
-        return int(self.queue_per_user_max.get(gid, QUEUE_MAX_PER_USER))
+        return self.queue_per_user_max.get(gid, QUEUE_MAX_PER_USER)
+
+    def _limit_settings(self, gid: int) -> tuple[bool, int, int]:
+        """(limit on, max per add, max per user) for this guild in one call."""
+        return self._limit_is_on(gid), self._limit_max(gid), self._per_user_max(gid)
+
+    def _set_queue_limit(
+        self,
+        gid: int,
+        *,
+        enabled: bool | None = None,
+        max_per_add: int | None = None,
+        per_user_max: int | None = None,
+    ) -> tuple[bool, int, int]:
+        """Shared body of the queue_limit_* setters: apply whichever fields were given, then persist."""
+        if enabled is not None:
+            self.queue_limit_enabled[gid] = bool(enabled)
+        if max_per_add is not None:
+            self.queue_limit_max[gid] = max(1, int(max_per_add))
+        if per_user_max is not None:
+            self.queue_per_user_max[gid] = max(1, int(per_user_max))
+        return self._store_queue_limit(gid)
+
+    async def _send_latest(self, channel, embed: discord.Embed) -> None:
+        """
+        Send a state-reply embed; while one is already in flight to this channel,
+        only the newest waiting embed is sent after it (older ones are dropped).
+        """
+        cid = channel.id
+        if cid in self._embed_inflight:
+            self._pending_embeds[cid] = embed
+            return
+        self._embed_inflight.add(cid)
+        try:
+            while embed is not None:
+                try:
+                    await channel.send(embed=embed)
+                except Exception as e:
+                    print(f"[send] coalesced embed failed in {cid}: {e}")
+                embed = self._pending_embeds.pop(cid, None)
+        finally:
+            self._embed_inflight.discard(cid)
+
+    def _store_queue_limit(self, gid: int) -> tuple[bool, int, int]:
+        """Persist the current limit settings for this guild; returns them for the reply."""
+        enabled, maxn, per_user = self._limit_settings(gid)
+        stored = {"enabled": enabled, "max": maxn, "per_user_max": per_user}
+        amap = self.user_mappings[gid]
+        if amap.get("queue_limit") != stored:  # repeated toggles to the same state don't re-save
+            amap["queue_limit"] = stored
+            self._mark_dirty(gid)
+        return enabled, maxn, per_user
 
     def _enforce_queue_add_limit(self, gid: int, intended_count: int, *, bypass: bool = False) -> tuple[int, str | None]:
         if bypass or (not self._limit_is_on(gid)):
@@ -1325,12 +1728,11 @@ class RadioBot(commands.Cog):
     # ========================================================================
 
     def get_radio_channel(self, ctx):
-        RADIO_CONTROL_CHANNEL = os.getenv("RADIO_CONTROL_CHANNEL")
-        if RADIO_CONTROL_CHANNEL:
+        if RADIO_CONTROL_CHANNEL_ID:
             try:
-                radio_channel = ctx.guild.get_channel(int(RADIO_CONTROL_CHANNEL))
+                radio_channel = ctx.guild.get_channel(RADIO_CONTROL_CHANNEL_ID)
                 return radio_channel if radio_channel else ctx.channel
-            except:
+            except Exception:
                 pass
         return ctx.channel
 
@@ -1338,12 +1740,18 @@ class RadioBot(commands.Cog):
         mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
 
-    async def _resolve_tracks(self, items: list[dict], max_workers: int = 6) -> list[dict]:
-        loop = asyncio.get_event_loop()
+    async def _extract_one(self, url: str) -> dict | None:
+        """extract_song_info for a single URL on the resolver pool (cache-aware); raises on failure."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._resolver_pool, _extract_cached, {"url": url}
+        )
+
+    async def _resolve_tracks(self, items: list[dict]) -> list[dict]:
+        loop = asyncio.get_running_loop()
 
         def _resolve_one(item: dict) -> dict:
             try:
-                info = extract_song_info(item.get("url") or item.get("suno_url") or "")
+                info = _extract_cached(item)
                 if info:
                     item.update(info)
             except Exception as e:
@@ -1354,9 +1762,9 @@ class RadioBot(commands.Cog):
             item.setdefault("thumbnail", None)
             return item
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = [loop.run_in_executor(ex, _resolve_one, it) for it in items]
-            return await asyncio.gather(*futures)
+        return await asyncio.gather(
+            *[loop.run_in_executor(self._resolver_pool, _resolve_one, it) for it in items]
+        )
 
     async def set_song_activity(self, song, elapsed_seconds):
         try:
@@ -1365,15 +1773,50 @@ class RadioBot(commands.Cog):
             current_time = self.format_time(elapsed_seconds)
             total_time = self.format_time(duration)
 
-            activity_name = f"🎶 {title} - {current_time} / {total_time}"
-            activity = discord.Activity(
-                type=discord.ActivityType.listening,
-                name=activity_name[:128]
-            )
-            await self.bot.change_presence(activity=activity)
+            activity_name = f"🎶 {title} - {current_time} / {total_time}"[:128]
+            if activity_name == self._last_presence_name:
+                return
+            wait = PRESENCE_MIN_INTERVAL_SEC - (time.monotonic() - self._last_presence_ts)
+            if wait > 0:
+                # too soon after the last update: keep only the newest and send it later
+                self._presence_pending = activity_name
+                if self._presence_flush_task is None or self._presence_flush_task.done():
+                    self._presence_flush_task = asyncio.create_task(self._flush_presence(wait))
+                return
+            await self._send_presence(activity_name)
+        except Exception as e:
+            print(f"Error setting song activity: {e}")
+
+    async def _send_presence(self, activity_name: str):
+        activity = discord.Activity(
+            type=discord.ActivityType.listening,
+            name=activity_name
+        )
+        self._last_presence_name = activity_name
+        self._last_presence_ts = time.monotonic()
+        await self.bot.change_presence(activity=activity)
+
+    async def _flush_presence(self, delay: float):
+        try:
+            await asyncio.sleep(max(0.0, delay))
+            name, self._presence_pending = self._presence_pending, None
+            if name and name != self._last_presence_name:
+                await self._send_presence(name)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             print(f"Error setting song activity: {e}")
 
+    async def _clear_presence(self):
+        """Clear the activity now, dropping any rate-limited update still pending."""
+        self._presence_pending = None
+        if self._presence_flush_task is not None and not self._presence_flush_task.done():
+            self._presence_flush_task.cancel()
+        self._presence_flush_task = None
+        self._last_presence_name = None
+        # not stamped: the clear→set pair on a track change should land the new song right away
+        await self.bot.change_presence(activity=None)
+
     async def _fade_in_volume(self, transformer, target, duration, steps):
         try:
             if duration <= 0 or transformer is None:
@@ -1400,64 +1843,75 @@ class RadioBot(commands.Cog):
             elapsed = time.time() - self.song_start_time
             await self.set_song_activity(self.current_song, elapsed)
 
-    async def cog_load(self):
-        for guild in self.bot.guilds:
-            loaded_queues, loaded_playlists, loaded_user_mappings = load_data(guild.id)
-            if guild.id in loaded_queues:
-                self.queues[guild.id] = loaded_queues[guild.id]
-            if guild.id in loaded_playlists:
-                self.playlists[guild.id] = loaded_playlists[guild.id]
-            if guild.id in loaded_user_mappings:
-                self.user_mappings[guild.id] = loaded_user_mappings[guild.id]
-
-            gid = guild.id
-            amap = self.user_mappings[gid]
-            ainfo = amap.get("autofill") if isinstance(amap, dict) else None
-
-            enabled_default = True
-
-            if isinstance(ainfo, dict):
-                url = (ainfo.get("url") or "").strip()
-                enabled = bool(ainfo.get("enabled", enabled_default))
-                csv_path = (ainfo.get("csv") or "").strip() if isinstance(ainfo, dict) else ""
+    async def _restore_one(self, guild):
+        """Load one guild's persisted state (file I/O off the loop) and apply autofill defaults."""
+        loaded_queues, loaded_playlists, loaded_user_mappings = await asyncio.to_thread(load_data, guild.id)
+        if guild.id in loaded_queues:
+            self.queues[guild.id] = TrackQueue(loaded_queues[guild.id])
+        if guild.id in loaded_playlists:
+            self.playlists[guild.id] = loaded_playlists[guild.id]
+        if guild.id in loaded_user_mappings:
+            amap = loaded_user_mappings[guild.id]
+            # normalized once here; user_mappings is a defaultdict(dict) so handlers index it directly
+            self.user_mappings[guild.id] = amap if isinstance(amap, dict) else {}
+
+        gid = guild.id
+        ainfo = self._get_autofill_cfg(gid)  # normalizes the mapping schema once per load
+
+        enabled_default = True
+        url = (ainfo.get("url") or "").strip()
+        csv_path = (ainfo.get("csv") or "").strip()
 
-                if url:
-                    self.auto_playlist_urls[gid] = url
-                self.auto_play_enabled[gid] = enabled
+        if url:
+            self.auto_playlist_urls[gid] = url
+        self.auto_play_enabled[gid] = bool(ainfo.get("enabled", enabled_default))
+
+        if not url and csv_path:
+            self.autofill_seed_rows[gid] = await asyncio.to_thread(self._load_autofill_csv, csv_path)
+
+        if not self.auto_playlist_urls.get(gid):
+            if DEFAULT_AUTOFILL_URL:
+                self.auto_playlist_urls[gid] = DEFAULT_AUTOFILL_URL
+                ainfo.clear()
+                ainfo.update(url=DEFAULT_AUTOFILL_URL, enabled=self.auto_play_enabled[gid])
+                self._mark_dirty(gid)
+            elif DEFAULT_AUTOFILL_CSV:
+                rows = await asyncio.to_thread(self._load_autofill_csv, DEFAULT_AUTOFILL_CSV)
+                if rows:
+                    self.autofill_seed_rows[gid] = rows
+                    ainfo.clear()
+                    ainfo.update(csv=DEFAULT_AUTOFILL_CSV, enabled=self.auto_play_enabled[gid])
+                    self._mark_dirty(gid)
 
-                if not url and csv_path:
-                    self.autofill_seed_rows[gid] = self._load_autofill_csv(csv_path)
-            else:
-                if not isinstance(amap, dict):
-                    amap = {}
-                    self.user_mappings[gid] = amap
-                self.auto_play_enabled[gid] = enabled_default
-
-            if not self.auto_playlist_urls.get(gid):
-                if DEFAULT_AUTOFILL_URL:
-                    self.auto_playlist_urls[gid] = DEFAULT_AUTOFILL_URL
-                    amap = self.user_mappings[gid]
-                    amap["autofill"] = {
-                        "url": DEFAULT_AUTOFILL_URL,
-                        "enabled": self.auto_play_enabled.get(gid, enabled_default),
-                    }
-                    save_data(gid, self.queues, self.playlists, self.user_mappings)
-                elif DEFAULT_AUTOFILL_CSV:
-                    rows = self._load_autofill_csv(DEFAULT_AUTOFILL_CSV)
-                    if rows:
-                        self.autofill_seed_rows[gid] = rows
-                        amap = self.user_mappings[gid]
-                        amap["autofill"] = {
-                            "csv": DEFAULT_AUTOFILL_CSV,
-                            "enabled": self.auto_play_enabled.get(gid, enabled_default),
-                        }
-                        save_data(gid, self.queues, self.playlists, self.user_mappings)
+    async def cog_load(self):
+        guilds = list(self.bot.guilds)
+        results = await asyncio.gather(
+            *(self._restore_one(g) for g in guilds), return_exceptions=True
+        )
+        for guild, res in zip(guilds, results):
+            if isinstance(res, Exception):
+                print(f"[cog_load] restore failed for guild {guild.id}: {res}")
+
+        if self._saver_task is None or self._saver_task.done():
+            self._saver_task = asyncio.create_task(self._saver_loop())
 
     async def cog_unload(self):
         if self.update_song_activity.is_running():
             self.update_song_activity.cancel()
+        if self._saver_task is not None:
+            self._saver_task.cancel()
+            self._saver_task = None
         try:
-            await self.bot.change_presence(activity=None)
+            await self._flush_saves()  # runs on _scrape_pool, so before the shutdown below
+        except Exception as e:
+            print(f"[persist] flush on unload failed: {e}")
+        self._resolver_pool.shutdown(wait=False)
+        self._scrape_pool.shutdown(wait=False)
+        for task in list(self._prefetch_tasks.values()):
+            task.cancel()
+        self._io_exec.shutdown(wait=False)
+        try:
+            await self._clear_presence()
         except Exception:
             pass
 
@@ -1532,7 +1986,7 @@ class RadioBot(commands.Cog):
         self.song_start_time = None
         if self.update_song_activity.is_running():
             self.update_song_activity.stop()
-        await self.bot.change_presence(activity=None)
+        await self._clear_presence()
         embed = discord.Embed(title="👋 Left", description=f"Left {channel_name} 🎧", color=0xff0000)
         await ctx.send(embed=embed)
 
@@ -1551,11 +2005,10 @@ class RadioBot(commands.Cog):
         self._cancel_autofill_task(guild_id)
         self._clear_autofill_from_queue(guild_id)
 
-        requester_id = ctx.author.id
-        requester_tag = str(ctx.author)
-        requester_name = ctx.author.display_name
-        requester_mention = ctx.author.mention
-        requested_at = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        requested_at = int(time.time())
+        requester = _requester_fields(ctx.author, requested_at)
+        requester_id = requester["requester_id"]
+        requester_mention = requester["requester_mention"]
         remaining_user_slots = self._user_slots_remaining(guild_id, requester_id)
         is_admin = self._is_admin(ctx.author)
         if is_admin:
@@ -1563,9 +2016,9 @@ class RadioBot(commands.Cog):
 
         try:
             if not url.strip():
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    raw_tracks = await asyncio.get_event_loop().run_in_executor(
-                        executor, scrape_suno_songs, "", 5
+                async with self._user_fetch_sem[requester_id]:
+                    raw_tracks = await asyncio.get_running_loop().run_in_executor(
+                        self._scrape_pool, scrape_suno_songs, "", 5
                     )
                 if not raw_tracks:
                     embed = discord.Embed(title="❌ Error", description="Failed to scrape Suno songs.", color=0xff0000)
@@ -1588,17 +2041,15 @@ class RadioBot(commands.Cog):
                 if allowed_total < intended:
                     raw_tracks = raw_tracks[:allowed_total]
 
-                tracks = await self._resolve_tracks(raw_tracks, max_workers=4)
+                async with self._user_fetch_sem[requester_id]:
+                    tracks = await self._resolve_tracks(raw_tracks)
 
                 for song in tracks:
-                    song["requester_id"] = requester_id
-                    song["requester_tag"] = requester_tag
-                    song["requester_name"] = requester_name
-                    song["requester_mention"] = requester_mention
-                    song["requested_at"] = requested_at
-                    self.queues[guild_id].append(song)
+                    song.update(requester)
+                    _render_parts(song)
+                self.queues[guild_id].extend(tracks)
 
-                save_data(guild_id, self.queues, self.playlists, self.user_mappings)
+                self._mark_dirty(guild_id)
 
                 desc = f"Added {len(tracks)} songs"
                 if notice:
@@ -1615,24 +2066,22 @@ class RadioBot(commands.Cog):
                 )
                 await ctx.send(embed=embed)
             else:
-                song = extract_song_info(url)
+                async with self._user_fetch_sem[requester_id]:
+                    song = await self._extract_one(url)
                 if song is None:
                     raise ValueError("Failed to extract song information: extract_song_info returned None")
                 song.setdefault("artist", song.pop("author", None))
 
-                song["requester_id"] = requester_id
-                song["requester_tag"] = requester_tag
-                song["requester_name"] = requester_name
-                song["requester_mention"] = requester_mention
-                song["requested_at"] = requested_at
+                song.update(requester)
 
                 if remaining_user_slots <= 0:
                     await ctx.send(embed=self._deny_user_cap_embed(requester_mention))
                     return
 
+                _render_parts(song)
                 queue.append(song)
                 position = len(queue)
-                save_data(guild_id, self.queues, self.playlists, self.user_mappings)
+                self._mark_dirty(guild_id)
 
                 eta_sec, eta_unknown = self._estimate_eta_seconds(guild_id, position)
                 embed = build_added_embed(
@@ -1697,7 +2146,7 @@ class RadioBot(commands.Cog):
                 self.song_start_time = None
                 if self.update_song_activity.is_running():
                     self.update_song_activity.stop()
-                await self.bot.change_presence(activity=None)
+                await self._clear_presence()
                 return
 
             channel = self.get_radio_channel(ctx)
@@ -1707,13 +2156,7 @@ class RadioBot(commands.Cog):
             requester_in_vc = await self._check_requester_in_vc(ctx, song)
             if not requester_in_vc:
                 # Requester left, skip this song
-                requester_mention = (
-                    song.get("requester_mention")
-                    or (f"<@{song['requester_id']}>" if song.get("requester_id") else None)
-                    or song.get("requester_tag")
-                    or song.get("requester_name")
-                    or "someone"
-                )
+                requester_mention = _requester_mention(song)
                 song_title = song.get("title") or "Unknown"
                 
                 if SHOW_SKIP_MESSAGE:
@@ -1760,49 +2203,16 @@ class RadioBot(commands.Cog):
 
             local_to_delete = None
             try:
-                lp = await maybe_prefetch(song)
+                await self._await_prefetch(song)
+                lp = await maybe_prefetch(song, self._io_exec)
                 if lp and PREFETCH_MODE == "full":
                     local_to_delete = lp
             except Exception as e:
                 print(f"Prefetch failed for {song.get('url')}: {e}")
 
-            # ---- FFmpeg options (latency + stability tuned) ------------------
-            af_filter = (
-                "aresample=async=1:min_hard_comp=0.10:first_pts=0,"
-                f"adelay={STARTUP_ADELAY_MS}|{STARTUP_ADELAY_MS}"
-            )
-            base_opts = (
-                f"-vn "
-                f"-probesize {FFMPEG_PROBESIZE} "
-                f"-analyzeduration {FFMPEG_ANALYZEDURATION} "
-                f"-thread_queue_size {FFMPEG_THREAD_QUEUE_SIZE} "
-                f"-buffer_size {FFMPEG_BUFFER_SIZE} "
-                f"-max_delay {FFMPEG_MAX_DELAY_US} "
-                f"-af {af_filter}"
-            )
-            if FFMPEG_NOBUFFER:
-                base_opts += " -fflags +nobuffer"
-
+            # classify per start: a background prefetch may have swapped url to a local file
             url_val = str(song.get("url", "")).strip()
-            is_http = url_val.startswith(("http://", "https://"))
-
-            if is_http:
-                before_opts = (
-                    "-reconnect 1 "
-                    "-reconnect_streamed 1 "
-                    "-reconnect_at_eof 1 "
-                    "-reconnect_delay_max 5 "
-                    f"-rw_timeout {FFMPEG_RW_TIMEOUT_US} "
-                    "-nostdin"
-                )
-                ffmpeg_options = {
-                    "before_options": before_opts,
-                    "options": base_opts,
-                }
-            else:
-                ffmpeg_options = {
-                    "options": base_opts,
-                }
+            ffmpeg_options = _FFMPEG_STREAM if url_val.startswith(("http://", "https://")) else _FFMPEG_LOCAL
 
             try:
                 source = discord.FFmpegPCMAudio(url_val, **ffmpeg_options)
@@ -1833,18 +2243,11 @@ class RadioBot(commands.Cog):
                     except Exception as e_end:
                         print(f"[history] end log failed: {e_end}")
 
-                    if local_to_delete:
-                        try:
-                            if os.path.exists(local_to_delete):
-                                os.remove(local_to_delete)
-                        except Exception as _e:
-                            print(f"Prefetch cleanup failed: {local_to_delete}: {_e}")
-
                     self.current_song = None
                     self.song_start_time = None
                     if self.update_song_activity.is_running():
                         self.update_song_activity.stop()
-                    asyncio.run_coroutine_threadsafe(self.bot.change_presence(activity=None), self.bot.loop)
+                    asyncio.run_coroutine_threadsafe(self._clear_presence(), self.bot.loop)
 
                     if queue and ctx.voice_client:
                         self.bot.loop.call_soon_threadsafe(lambda: self.bot.loop.create_task(self.play_next(ctx)))
@@ -1855,6 +2258,13 @@ class RadioBot(commands.Cog):
                             self.bot.loop.call_soon_threadsafe(lambda: self._schedule_autofill_if_idle(ctx))
                         except Exception as _e:
                             print(f"[autofill schedule] {_e}")
+
+                    # unlink after the next track is scheduled so slow disks don't widen the gap
+                    if local_to_delete:
+                        try:
+                            self._scrape_pool.submit(self._cleanup_prefetch, local_to_delete)
+                        except RuntimeError:  # pool already shut down (cog unloading)
+                            self._cleanup_prefetch(local_to_delete)
                 except Exception as e2:
                     print(f"after_playing crashed: {e2}")
 
@@ -1903,7 +2313,7 @@ class RadioBot(commands.Cog):
             requester = (song.get("requester_mention")
                          or song.get("requester_name")
                          or song.get("requester_tag"))
-            upcoming_two = list(self.queues[gid])[:2]
+            upcoming_two = list(itertools.islice(self.queues[gid], 2))
             np_embed = build_now_playing_embed(song, requester_mention=requester, upcoming_tracks=upcoming_two)
 
             song_url = _derive_suno_url(song) or (song.get("url") or "")
@@ -1919,7 +2329,12 @@ class RadioBot(commands.Cog):
             )
 
             ch = self.get_radio_channel(ctx)
-            sent_message = await ch.send(embed=np_embed, view=view)
+            async with self._np_send_locks[ch.id]:
+                # skip storms: no sleeping under the play lock, just drop cards that come too fast
+                if time.monotonic() - self._np_last_sent.get(ch.id, 0.0) < NP_MIN_INTERVAL_SEC:
+                    return
+                sent_message = await ch.send(embed=np_embed, view=view)
+                self._np_last_sent[ch.id] = time.monotonic()
 
             try:
                 if sent_message:
@@ -1942,7 +2357,8 @@ class RadioBot(commands.Cog):
         """
         guild_id = ctx.guild.id
         queue = self.queues[guild_id]
-        if not queue:
+        total = len(queue)
+        if not total:
             embed = discord.Embed(
                 title="📋 Queue",
                 description="Queue is empty! Add songs with `!play`.",
@@ -1951,29 +2367,19 @@ class RadioBot(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        eta_list = self._queue_eta_list(guild_id)
-
         max_lines = 15
+        eta_list = self._queue_eta_list(guild_id, limit=max_lines)
+
         lines = []
-        for i, (song, eta_sec) in enumerate(zip(queue, eta_list), start=1):
-            title_link = _track_title_link(song) + _filler_badge(song)
-            artist_raw = (song.get("artist") or song.get("author") or "Unknown Artist").strip()
-            artist = escape_markdown(artist_raw)
-            requester = (song.get("requester_mention")
-                         or (f"<@{song['requester_id']}>" if song.get("requester_id") else None)
-                         or song.get("requester_tag")
-                         or song.get("requester_name")
-                         or "someone")
-            if eta_sec is None:
-                eta_str = "≈unknown"
-            else:
-                eta_str = _fmt_duration(max(0, int(eta_sec)))
+        render, esc, fmt = _render_parts, _esc, _fmt_duration
+        for i, (song, eta_sec) in enumerate(zip(itertools.islice(queue, max_lines), eta_list), start=1):
+            r = render(song)  # title link + filler badge and requester, cached on the track
+            artist = esc((song.get("artist") or song.get("author") or "Unknown Artist").strip())
+            eta_str = "≈unknown" if eta_sec is None else fmt(max(0, int(eta_sec)))
 
-            lines.append(f"{i}. {title_link} by {artist}\n Up in ~{eta_str} / Requested by {requester}")
-            if i >= max_lines:
-                break
+            lines.append(f"{i}. {r['title_md']} by {artist}\n Up in ~{eta_str} / Requested by {r['requester']}")
 
-        remaining = len(queue) - max_lines
+        remaining = total - max_lines
         if remaining > 0:
             lines.append(f"… and **{remaining}** more in queue")
 
@@ -1999,17 +2405,10 @@ class RadioBot(commands.Cog):
             q = self.queues[gid]
             if not q:
                 return 0
-            kept = []
-            removed = 0
-            for item in q:
-                if item.get("_autofill"):
-                    removed += 1
-                else:
-                    kept.append(item)
-            q.clear()
-            q.extend(kept)
+            removed = q.autofill_count
+            self._clear_autofill_from_queue(gid)  # in-place rotate-and-drop
             if removed:
-                save_data(gid, self.queues, self.playlists, self.user_mappings)
+                self._mark_dirty(gid)
             return removed
 
         if target == "autofill":
@@ -2055,7 +2454,7 @@ class RadioBot(commands.Cog):
         self.queues[gid].clear()
 
         if CLEAR_PLAYLISTS_ON_STOP:
-            self.playlists[gid].clear()
+            self.playlists.pop(gid, None)
 
         self._cancel_autofill_task(gid)
         self._clear_autofill_from_queue(gid)
@@ -2064,9 +2463,9 @@ class RadioBot(commands.Cog):
         self.song_start_time = None
         if self.update_song_activity.is_running():
             self.update_song_activity.stop()
-        await self.bot.change_presence(activity=None)
+        await self._clear_presence()
 
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(gid)
 
         msg = "Stopped and cleared queue! 😴"
         if CLEAR_PLAYLISTS_ON_STOP:
@@ -2091,9 +2490,9 @@ class RadioBot(commands.Cog):
         await self.stop(ctx)
 
     @commands.command(name='shuffle')
-    async def shuffle_queue(self, ctx):
+    async def shuffle_queue(self, ctx, depth: int = SHUFFLE_DEPTH):
         """
-        Shuffles the current queue
+        Shuffles the current queue (`!shuffle 0` shuffles all of it)
         """
         guild_id = ctx.guild.id
         queue = self.queues[guild_id]
@@ -2104,11 +2503,11 @@ class RadioBot(commands.Cog):
         items = list(queue)
         
         # random.shuffle(items) vvv changed by Paul Schirf
-        shuffle_displacing_first_inplace(items)
+        shuffle_displacing_first_inplace(items, depth=depth)
 
         queue.clear()
         queue.extend(items)
-        save_data(guild_id, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(guild_id)
         embed = discord.Embed(title="🔀 Shuffled", description="Queue has been shuffled! 🎲", color=0x00ff00)
         await ctx.send(embed=embed)
 
@@ -2164,10 +2563,11 @@ class RadioBot(commands.Cog):
         self._clear_autofill_from_queue(guild_id)
 
         try:
-            loop = asyncio.get_event_loop()
-            raw_tracks = await loop.run_in_executor(
-                None, lambda: scrape_suno_songs(url, limit=max_items)
-            )
+            loop = asyncio.get_running_loop()
+            async with self._user_fetch_sem[ctx.author.id]:
+                raw_tracks = await loop.run_in_executor(
+                    self._scrape_pool, scrape_suno_songs, url, max_items
+                )
             if not raw_tracks:
                 embed = discord.Embed(
                     title="❌ No Tracks Found",
@@ -2192,23 +2592,21 @@ class RadioBot(commands.Cog):
             if allowed < intended:
                 raw_tracks = raw_tracks[:allowed]
 
-            tracks = await self._resolve_tracks(raw_tracks, max_workers=6)
+            async with self._user_fetch_sem[ctx.author.id]:
+                tracks = await self._resolve_tracks(raw_tracks)
 
             # ✅ define timestamp once
-            now_ts = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+            now_ts = int(time.time())
 
             start_pos = len(queue) + 1
+            requester = _requester_fields(ctx.author, now_ts)
             for t in tracks:
-                t["requester_id"] = ctx.author.id
-                t["requester_tag"] = str(ctx.author)
-                t["requester_name"] = ctx.author.display_name
-                t["requester_mention"] = ctx.author.mention
-                t["requested_at"] = now_ts
+                t.update(requester)
                 t["_from_playlist"] = True  # optional but nice if you want later filtering
-                queue.append(t)
+            queue.extend(tracks)
 
             end_pos = len(queue)
-            save_data(guild_id, self.queues, self.playlists, self.user_mappings)
+            self._mark_dirty(guild_id)
 
             desc = f"Added {len(tracks)} tracks!"
             if end_pos >= start_pos:
@@ -2253,12 +2651,11 @@ class RadioBot(commands.Cog):
             return
 
         idx = position - 1
-        queue_list = list(queue)
-        removed_song = queue_list[idx]
-        queue_list.pop(idx)
-        queue.clear()
-        queue.extend(queue_list)
-        save_data(guild_id, self.queues, self.playlists, self.user_mappings)
+        # rotate the target to the front, drop it, rotate back: no list copy
+        queue.rotate(-idx)
+        removed_song = queue.popleft()
+        queue.rotate(idx)
+        self._mark_dirty(guild_id)
 
         embed = discord.Embed(title="🗑️ Removed", description=f"Removed: {removed_song.get('title','Untitled')} from position {position}", color=0x00ff00)
         await ctx.send(embed=embed)
@@ -2282,18 +2679,18 @@ class RadioBot(commands.Cog):
             self.song_start_time = None
             if self.update_song_activity.is_running():
                 self.update_song_activity.stop()
-            await self.bot.change_presence(activity=None)
+            await self._clear_presence()
 
             gid = ctx.guild.id
             self.queues[gid].clear()
 
             if CLEAR_PLAYLISTS_ON_RELOAD:
-                self.playlists[gid].clear()
+                self.playlists.pop(gid, None)
 
             self._cancel_autofill_task(gid)
             self._clear_autofill_from_queue(gid)
 
-            save_data(gid, self.queues, self.playlists, self.user_mappings)
+            await self._save(gid)
 
             await self.bot.unload_extension('src.cogs.music')
             await self.bot.load_extension('src.cogs.music')
@@ -2314,7 +2711,7 @@ class RadioBot(commands.Cog):
         """
         gid = ctx.guild.id
         self.queues[gid].clear()
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(gid)
         await ctx.send(embed=discord.Embed(title="🧹 Queue Cleared", description="All queued tracks removed.", color=0x00ff00))
 
     @commands.command(name='playlist_clear')
@@ -2341,7 +2738,7 @@ class RadioBot(commands.Cog):
         q.clear()
         q.extend(kept)
 
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(gid)
 
         desc = (
             f"Removed **{removed}** playlist-added track(s) from the queue."
@@ -2363,11 +2760,11 @@ class RadioBot(commands.Cog):
         """
         gid = ctx.guild.id
         self.queues[gid].clear()
-        self.playlists[gid].clear()
+        self.playlists.pop(gid, None)
         self.user_mappings[gid].clear()
         self._cancel_autofill_task(gid)
         self._clear_autofill_from_queue(gid)
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(gid)
         await ctx.send(embed=discord.Embed(title="♻️ State Reset", description="Queues, playlists, and mappings wiped.", color=0xff9900))
 
     # ========== Autofill Admin/User Commands =================================
@@ -2386,12 +2783,10 @@ class RadioBot(commands.Cog):
         self.auto_playlist_urls[gid] = the_url
         self.auto_play_enabled[gid] = True
 
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        amap["autofill"] = {"url": the_url, "enabled": True}
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        cfg = self._get_autofill_cfg(gid)
+        cfg["url"] = the_url
+        cfg["enabled"] = True
+        self._mark_dirty(gid)
 
         await ctx.send(embed=discord.Embed(
             title="🟢 Autofill Source Set",
@@ -2411,14 +2806,8 @@ class RadioBot(commands.Cog):
         gid = ctx.guild.id
         self.auto_play_enabled[gid] = True
 
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        ainfo = amap.get("autofill", {})
-        ainfo["enabled"] = True
-        amap["autofill"] = ainfo
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._get_autofill_cfg(gid)["enabled"] = True
+        self._mark_dirty(gid)
 
         await ctx.send(embed=discord.Embed(
             title="🟢 Autofill Enabled",
@@ -2437,14 +2826,8 @@ class RadioBot(commands.Cog):
         self._cancel_autofill_task(gid)
         self._clear_autofill_from_queue(gid)
 
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        ainfo = amap.get("autofill", {})
-        ainfo["enabled"] = False
-        amap["autofill"] = ainfo
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._get_autofill_cfg(gid)["enabled"] = False
+        self._mark_dirty(gid)
 
         await ctx.send(embed=discord.Embed(
             title="🔴 Autofill Disabled",
@@ -2580,17 +2963,12 @@ class RadioBot(commands.Cog):
             except Exception:
                 self.auto_playlist_urls[gid] = ""
 
-        amap = self.user_mappings.get(gid)
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        ainfo = amap.get("autofill", {})
-        enabled_state = bool(self.auto_play_enabled.get(gid, ainfo.get("enabled", True)))
-        ainfo["enabled"] = enabled_state
-        ainfo["url"] = ""
-        amap["autofill"] = ainfo
+        cfg = self._get_autofill_cfg(gid)
+        enabled_state = bool(self.auto_play_enabled.get(gid, cfg.get("enabled", True)))
+        cfg["enabled"] = enabled_state
+        cfg["url"] = ""
 
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
+        self._mark_dirty(gid)
 
         desc_lines = [
             "Cleared the **autofill URL override**.",
@@ -2688,19 +3066,8 @@ class RadioBot(commands.Cog):
         """
         Turn the queue limit on (Admin only)
         """
-        gid = ctx.guild.id
-        self.queue_limit_enabled[gid] = True
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        amap["queue_limit"] = {"enabled": True, "max": self._limit_max(gid)}
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
-        await ctx.send(embed=discord.Embed(
-            title="📦 Queue Limit",
-            description=f"Queue limit is **ON** (max {self._limit_max(gid)} per add).",
-            color=0x2ecc71
-        ))
+        settings = self._set_queue_limit(ctx.guild.id, enabled=True)
+        await self._send_latest(ctx.channel, discord.Embed.from_dict(_queue_limit_toggle_dict(*settings)))
 
     @commands.has_permissions(administrator=True)
     @commands.command(name="queue_limit_off")
@@ -2709,29 +3076,8 @@ class RadioBot(commands.Cog):
         Turn the queue limit off (Admin only).
         Optionally also set the per-user cap while limits are off, e.g. !queue_limit_off 5
         """
-        gid = ctx.guild.id
-        self.queue_limit_enabled[gid] = False
-
-        if per_user_max is not None:
-            per_user_max = max(1, int(per_user_max))
-            self.queue_per_user_max[gid] = per_user_max
-
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-
-        amap["queue_limit"] = {
-            "enabled": False,
-            "max": self._limit_max(gid),
-            "per_user_max": self._per_user_max(gid),
-        }
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
-        await ctx.send(embed=discord.Embed(
-            title="📦 Queue Limit",
-            description=f"Queue limit is **OFF**.\nPer-user cap: **{self._per_user_max(gid)}**",
-            color=0xe67e22
-        ))
+        settings = self._set_queue_limit(ctx.guild.id, enabled=False, per_user_max=per_user_max)
+        await self._send_latest(ctx.channel, discord.Embed.from_dict(_queue_limit_toggle_dict(*settings)))
 
     @commands.has_permissions(administrator=True)
     @commands.command(name="queue_limit_set")
@@ -2742,33 +3088,8 @@ class RadioBot(commands.Cog):
           !queue_limit_set 5 -> sets max per add to 5, leaves per-user cap as-is
           !queue_limit_set 5 3 -> sets max per add to 5 and per-user cap to 3
         """
-        gid = ctx.guild.id
-        max_per_add = max(1, int(max_per_add))
-        self.queue_limit_max[gid] = max_per_add
-
-        if per_user_max is not None:
-            per_user_max = max(1, int(per_user_max))
-            self.queue_per_user_max[gid] = per_user_max
-
-        amap = self.user_mappings[gid]
-        if not isinstance(amap, dict):
-            amap = {}
-            self.user_mappings[gid] = amap
-        enabled = self._limit_is_on(gid)
-        amap["queue_limit"] = {
-            "enabled": enabled,
-            "max": max_per_add,
-            "per_user_max": self._per_user_max(gid),
-        }
-        save_data(gid, self.queues, self.playlists, self.user_mappings)
-
-        desc = [f"Max songs per add set to **{max_per_add}**."]
-        desc.append(f"Per-user cap: **{self._per_user_max(gid)}**")
-        await ctx.send(embed=discord.Embed(
-            title="📦 Queue Limit",
-            description="\n".join(desc),
-            color=0x3498db
-        ))
+        settings = self._set_queue_limit(ctx.guild.id, max_per_add=max_per_add, per_user_max=per_user_max)
+        await self._send_latest(ctx.channel, discord.Embed.from_dict(_queue_limit_set_dict(*settings)))
 
     @commands.command(name="queue_limit_status")
     async def queue_limit_status(self, ctx):
@@ -2776,16 +3097,7 @@ class RadioBot(commands.Cog):
         Queue Limit Status (Admin only)
         """
         gid = ctx.guild.id
-        enabled = self._limit_is_on(gid)
-        maxn = self._limit_max(gid)
-        per_user_cap = self._per_user_max(gid)
-        await ctx.send(embed=discord.Embed(
-            title="ℹ️ Queue Limit Status",
-            description=f"**State:** {'ON' if enabled else 'OFF'}\n"
-                        f"**Max per add:** {maxn}\n"
-                        f"**Max per user:** {per_user_cap}",
-            color=0x7289DA
-        ))
+        await self._send_latest(ctx.channel, discord.Embed.from_dict(_queue_limit_status_dict(*self._limit_settings(gid))))
 
     @commands.has_permissions(administrator=True)
     @commands.command(name="ping")
@@ -2819,9 +3131,7 @@ class RadioBot(commands.Cog):
 
         # --- Feature toggles ---
         autofill_enabled = self._is_autofill_enabled(gid)
-        queue_limit_on = self._limit_is_on(gid)
-        max_per_add = self._limit_max(gid)
-        per_user_cap = self._per_user_max(gid)
+        queue_limit_on, max_per_add, per_user_cap = self._limit_settings(gid)
 
         desc_lines = [
             f"**WebSocket:** `{ws_ms} ms`",
@@ -4,11 +4,14 @@
 from __future__ import annotations
 import os
 import sqlite3
+import threading
 import time
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 _CONN: Optional[sqlite3.Connection] = None
 _DB_PATH: Optional[str] = None
+# The connection is shared across threads; one statement (plus its fetch) at a time.
+_LOCK = threading.Lock()
 
 
 def _dict_factory(cursor, row):
@@ -36,7 +39,9 @@ def init_db(db_path: Optional[str] = None) -> None:
     _DB_PATH = db_path or os.getenv("SUNO_RADIO_DB", "./suno_radio.db")
     os.makedirs(os.path.dirname(_DB_PATH) or ".", exist_ok=True)
 
-    conn = sqlite3.connect(_DB_PATH, isolation_level=None, check_same_thread=True)
+    # shared with worker threads (like buttons run via asyncio.to_thread; play-end
+    # logging runs on the voice thread), so don't pin it to the opening thread
+    conn = sqlite3.connect(_DB_PATH, isolation_level=None, check_same_thread=False)
     conn.row_factory = _dict_factory
     conn.execute("PRAGMA journal_mode = WAL;")
     conn.execute("PRAGMA foreign_keys = ON;")
@@ -148,19 +153,20 @@ def upsert_track_basic(*,
     duration_sec: Optional[int] = None,
 ) -> None:
     conn = get_conn()
-    conn.execute(
-        """
-        INSERT INTO tracks (id, title, artist, cover_url, source_url, duration_sec)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET
-            title=COALESCE(excluded.title, tracks.title),
-            artist=COALESCE(excluded.artist, tracks.artist),
-            cover_url=COALESCE(excluded.cover_url, tracks.cover_url),
-            source_url=COALESCE(excluded.source_url, tracks.source_url),
-            duration_sec=COALESCE(excluded.duration_sec, tracks.duration_sec)
-        """,
-        (track_id, title, artist, cover_url, source_url, duration_sec),
-    )
+    with _LOCK:
+        conn.execute(
+            """
+            INSERT INTO tracks (id, title, artist, cover_url, source_url, duration_sec)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title=COALESCE(excluded.title, tracks.title),
+                artist=COALESCE(excluded.artist, tracks.artist),
+                cover_url=COALESCE(excluded.cover_url, tracks.cover_url),
+                source_url=COALESCE(excluded.source_url, tracks.source_url),
+                duration_sec=COALESCE(excluded.duration_sec, tracks.duration_sec)
+            """,
+            (track_id, title, artist, cover_url, source_url, duration_sec),
+        )
 
 
 def log_play_start(*,
@@ -173,29 +179,31 @@ def log_play_start(*,
     """Create a plays row and return play_id."""
     conn = get_conn()
     now = int(time.time())
-    cur = conn.execute(
-        """
-        INSERT INTO plays (track_id, guild_id, channel_id, requested_by, context, started_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (track_id, str(guild_id), str(channel_id), requested_by, context, now),
-    )
-    return int(cur.lastrowid)
+    with _LOCK:
+        cur = conn.execute(
+            """
+            INSERT INTO plays (track_id, guild_id, channel_id, requested_by, context, started_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (track_id, str(guild_id), str(channel_id), requested_by, context, now),
+        )
+        return int(cur.lastrowid)
 
 
 def log_play_end(*, track_id: str, play_id: Optional[int] = None) -> None:
     conn = get_conn()
     now = int(time.time())
-    if play_id is not None:
-        conn.execute(
-            "UPDATE plays SET ended_at=? WHERE play_id=? AND ended_at IS NULL",
-            (now, play_id),
-        )
-    else:
-        conn.execute(
-            "UPDATE plays SET ended_at=? WHERE track_id=? AND ended_at IS NULL ORDER BY play_id DESC LIMIT 1",
-            (now, track_id),
-        )
+    with _LOCK:
+        if play_id is not None:
+            conn.execute(
+                "UPDATE plays SET ended_at=? WHERE play_id=? AND ended_at IS NULL",
+                (now, play_id),
+            )
+        else:
+            conn.execute(
+                "UPDATE plays SET ended_at=? WHERE track_id=? AND ended_at IS NULL ORDER BY play_id DESC LIMIT 1",
+                (now, track_id),
+            )
 
 
 # ------------------------------
@@ -209,18 +217,19 @@ def recent_plays(*, guild_id: int | str, limit: int = 10, include_autofill: bool
     if not include_autofill:
         where += " AND p.context != 'autofill'"
     params += [int(limit)]
-    return conn.execute(
-        f"""
-        SELECT p.play_id, p.started_at, p.ended_at, p.requested_by, p.context,
-               t.id AS track_id, t.title, t.artist, t.source_url
-        FROM plays p
-        JOIN tracks t ON t.id = p.track_id
-        {where}
-        ORDER BY p.play_id DESC
-        LIMIT ?
-        """,
-        params,
-    ).fetchall()
+    with _LOCK:
+        return conn.execute(
+            f"""
+            SELECT p.play_id, p.started_at, p.ended_at, p.requested_by, p.context,
+                   t.id AS track_id, t.title, t.artist, t.source_url
+            FROM plays p
+            JOIN tracks t ON t.id = p.track_id
+            {where}
+            ORDER BY p.play_id DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
 
 def top_tracks(*, guild_id: int | str, since_seconds: Optional[int], limit: int = 10, include_autofill: bool = False):
     conn = get_conn()
@@ -248,63 +257,69 @@ def top_tracks(*, guild_id: int | str, since_seconds: Optional[int], limit: int
         LIMIT ?
     """
     params.append(int(limit))
-    return conn.execute(sql, params).fetchall()
+    with _LOCK:
+        return conn.execute(sql, params).fetchall()
 
 def like_track(*, track_id: str, guild_id: int | str, user_id: int | str, username: str | None = None) -> int:
     """Add a like (allows multiple likes from same user). Returns total likes for this track in this guild."""
     conn = get_conn()
-    conn.execute(
-        "INSERT INTO likes(track_id, guild_id, user_id, username) VALUES(?,?,?,?)",
-        (track_id, str(guild_id), str(user_id), username),
-    )
-    row = conn.execute(
-        "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
-        (track_id, str(guild_id)),
-    ).fetchone()
+    with _LOCK:
+        conn.execute(
+            "INSERT INTO likes(track_id, guild_id, user_id, username) VALUES(?,?,?,?)",
+            (track_id, str(guild_id), str(user_id), username),
+        )
+        row = conn.execute(
+            "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
+            (track_id, str(guild_id)),
+        ).fetchone()
     return int(row["c"])
 
 def unlike_track(*, track_id: str, guild_id: int | str, user_id: int | str) -> int:
     """Remove one like (the most recent one). Returns new total."""
     conn = get_conn()
-    # Delete the most recent like for this user/track combination
-    conn.execute("""
-        DELETE FROM likes 
-        WHERE id = (
-            SELECT id FROM likes 
-            WHERE track_id=? AND guild_id=? AND user_id=?
-            ORDER BY created_at DESC, id DESC
-            LIMIT 1
-        )
-    """, (track_id, str(guild_id), str(user_id)))
-    row = conn.execute(
-        "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
-        (track_id, str(guild_id)),
-    ).fetchone()
+    with _LOCK:
+        # Delete the most recent like for this user/track combination
+        conn.execute("""
+            DELETE FROM likes 
+            WHERE id = (
+                SELECT id FROM likes 
+                WHERE track_id=? AND guild_id=? AND user_id=?
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+            )
+        """, (track_id, str(guild_id), str(user_id)))
+        row = conn.execute(
+            "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
+            (track_id, str(guild_id)),
+        ).fetchone()
     return int(row["c"])
 
 def has_liked(*, track_id: str, guild_id: int | str, user_id: int | str) -> bool:
     conn = get_conn()
-    row = conn.execute(
-        "SELECT 1 FROM likes WHERE track_id=? AND guild_id=? AND user_id=?",
-        (track_id, str(guild_id), str(user_id)),
-    ).fetchone()
+    with _LOCK:
+        row = conn.execute(
+            "SELECT 1 FROM likes WHERE track_id=? AND guild_id=? AND user_id=?",
+            (track_id, str(guild_id), str(user_id)),
+        ).fetchone()
     return bool(row)
 
 def get_like_count(*, track_id: str, guild_id: int | str) -> int:
     conn = get_conn()
-    row = conn.execute(
-        "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
-        (track_id, str(guild_id)),
-    ).fetchone()
+    with _LOCK:
+        row = conn.execute(
+            "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=?",
+            (track_id, str(guild_id)),
+        ).fetchone()
     return int(row["c"])
 
 def get_user_like_count(*, track_id: str, guild_id: int | str, user_id: int | str) -> int:
     """Get the number of times a specific user has liked a track."""
     conn = get_conn()
-    row = conn.execute(
-        "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=? AND user_id=?",
-        (track_id, str(guild_id), str(user_id)),
-    ).fetchone()
+    with _LOCK:
+        row = conn.execute(
+            "SELECT COUNT(*) AS c FROM likes WHERE track_id=? AND guild_id=? AND user_id=?",
+            (track_id, str(guild_id), str(user_id)),
+        ).fetchone()
     return int(row["c"])
 
 def top_liked_for_users(*, guild_id: int | str, user_ids: Iterable[int | str], limit: int = 50) -> list[dict]:
@@ -334,6 +349,6 @@ def top_liked_for_users(*, guild_id: int | str, user_ids: Iterable[int | str], l
         LIMIT ?
     """
     params = [str(guild_id)] + user_ids + [int(limit)]
-    cur = conn.execute(sql, params)
-    rows = cur.fetchall()
+    with _LOCK:
+        rows = conn.execute(sql, params).fetchall()
     return [dict(row) for row in rows]
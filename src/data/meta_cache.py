@@ -0,0 +1,131 @@
+# ---------------------------------------------------------------------------
+# FILE: src/data/meta_cache.py
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Resolved extract_song_info() results keyed by Suno song id, so repeat
+# autofill tracks skip the page fetch + parse (and survive extractor outages).
+META_CACHE_PATH = os.getenv("SUNO_META_CACHE", "./songs_meta.sqlite")
+META_CACHE_TTL_SEC = int(float(os.getenv("META_CACHE_TTL_DAYS", "30")) * 86400)
+META_MEM_MAX = int(os.getenv("META_MEM_MAX", "512"))  # in-process LRU in front of SQLite
+
+_CONN: Optional[sqlite3.Connection] = None
+_LOCK = threading.Lock()
+_MEM: "OrderedDict[str, tuple[int, dict]]" = OrderedDict()  # song_id -> (refreshed_at, meta)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS songs_meta (
+  song_id      TEXT PRIMARY KEY,
+  title        TEXT,
+  artist       TEXT,
+  duration     INTEGER,
+  thumbnail    TEXT,
+  prompt       TEXT,
+  lyrics       TEXT,
+  suno_url     TEXT,
+  meta_json    TEXT,
+  refreshed_at INTEGER NOT NULL
+);
+"""
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Lazily open the shared connection. Caller must hold _LOCK."""
+    global _CONN
+    if _CONN is None:
+        os.makedirs(os.path.dirname(META_CACHE_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(META_CACHE_PATH, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.executescript(_SCHEMA)
+        _CONN = conn
+    return _CONN
+
+
+def _is_stale(refreshed_at) -> bool:
+    return META_CACHE_TTL_SEC > 0 and int(time.time()) - int(refreshed_at or 0) > META_CACHE_TTL_SEC
+
+
+def _remember(song_id: str, refreshed_at: int, meta: dict) -> None:
+    """Insert into the in-memory LRU. Caller must hold _LOCK."""
+    if META_MEM_MAX <= 0:
+        return
+    _MEM[song_id] = (refreshed_at, meta)
+    _MEM.move_to_end(song_id)
+    while len(_MEM) > META_MEM_MAX:
+        _MEM.popitem(last=False)
+
+
+def get_meta(song_id: str) -> Optional[dict]:
+    """Return a copy of the cached extractor dict for song_id, or None if missing/stale."""
+    if not song_id:
+        return None
+    with _LOCK:
+        hit = _MEM.get(song_id)
+        if hit is not None:
+            if not _is_stale(hit[0]):
+                _MEM.move_to_end(song_id)
+                return dict(hit[1])
+            del _MEM[song_id]
+    try:
+        with _LOCK:
+            row = _get_conn().execute(
+                "SELECT meta_json, refreshed_at FROM songs_meta WHERE song_id = ?",
+                (song_id,),
+            ).fetchone()
+    except Exception as e:
+        print(f"[meta_cache] read failed for {song_id}: {e}")
+        return None
+    if not row:
+        return None
+    meta_json, refreshed_at = row
+    if _is_stale(refreshed_at):
+        return None
+    try:
+        meta = json.loads(meta_json or "null")
+    except Exception:
+        return None
+    if not isinstance(meta, dict) or not meta.get("url"):
+        return None
+    with _LOCK:
+        _remember(song_id, int(refreshed_at or 0), meta)
+    return dict(meta)
+
+
+def put_meta(song_id: str, meta: dict) -> None:
+    """Insert or refresh the cached extractor dict for song_id."""
+    if not song_id or not isinstance(meta, dict) or not meta.get("url"):
+        return
+    now = int(time.time())
+    with _LOCK:
+        _remember(song_id, now, dict(meta))
+    try:
+        with _LOCK:
+            _get_conn().execute(
+                """
+                INSERT OR REPLACE INTO songs_meta
+                  (song_id, title, artist, duration, thumbnail, prompt, lyrics, suno_url, meta_json, refreshed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    song_id,
+                    meta.get("title"),
+                    meta.get("artist"),
+                    meta.get("duration"),
+                    meta.get("thumbnail"),
+                    meta.get("prompt"),
+                    meta.get("lyrics"),
+                    meta.get("suno_url"),
+                    json.dumps(meta, ensure_ascii=False, default=str),
+                    now,
+                ),
+            )
+    except Exception as e:
+        print(f"[meta_cache] write failed for {song_id}: {e}")
@@ -1,6 +1,15 @@
+import copy
 import json
 from collections import deque, defaultdict
 import os
+import tempfile
+import threading
+
+# Optional: C JSON encoder for the save path (stdlib json is the fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DATA_DIR = 'data'
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -21,10 +30,23 @@ def fix_utf8_in_dict(data):
     else:
         return data
 
+# Runtime-only keys cached on track dicts (see _render_parts in the music cog).
+# They're re-derived on demand, so they never go to disk.
+_TRANSIENT_TRACK_KEYS = ('_render',)
+
+def _plain_track(t):
+    """Copy of a track dict without its runtime-only caches."""
+    if not isinstance(t, dict):
+        return t
+    d = dict(t)
+    for k in _TRANSIENT_TRACK_KEYS:
+        d.pop(k, None)
+    return d
+
 def load_data(guild_id):
     filename = os.path.join(DATA_DIR, f'guild_{guild_id}.json')
     queues = defaultdict(deque)
-    playlists = defaultdict(lambda: defaultdict(deque))
+    playlists = {}
     user_mappings = defaultdict(dict)
     if os.path.exists(filename):
         with open(filename, 'r', encoding='utf-8') as f:
@@ -32,22 +54,66 @@ def load_data(guild_id):
             # Fix UTF-8 encoding issues in loaded data (e.g., corrupted em-dashes)
             data = fix_utf8_in_dict(data)
             # Load queues as deques
+            # (older saves may still carry render caches; drop them)
             for k, v in data.get('queues', {}).items():
-                queues[k] = deque(v)
+                queues[k] = deque(map(_plain_track, v))
             # Load playlists as deques
             for k, v in data.get('playlists', {}).items():
-                playlists[k] = defaultdict(deque)
-                for kk, vv in v.items():
-                    playlists[k][kk] = deque(vv)
+                playlists[k] = {kk: deque(map(_plain_track, vv)) for kk, vv in v.items()}
             user_mappings = defaultdict(dict, data.get('user_mappings', {}))
     return queues, playlists, user_mappings
 
-def save_data(guild_id, queues, playlists, user_mappings):
-    filename = os.path.join(DATA_DIR, f'guild_{guild_id}.json')
-    data = {
-        'queues': {k: list(v) for k, v in queues.items()},
-        'playlists': {k: {kk: list(vv) for kk, vv in v.items()} for k, v in playlists.items()},
-        'user_mappings': user_mappings
+def snapshot_data(queues, playlists, user_mappings):
+    """
+    Copy of the state into plain lists/dicts, down to the track dicts and the
+    per-guild settings, so a worker thread can serialize it while the event
+    loop keeps mutating queues, tracks and settings. Cheap enough to run on
+    the loop: tracks are flat and the settings are a handful of keys.
+    Runtime-only track caches are left out.
+    """
+    return {
+        'queues': {k: [_plain_track(t) for t in v] for k, v in queues.items()},
+        'playlists': {k: {kk: [_plain_track(t) for t in vv] for kk, vv in v.items()} for k, v in playlists.items()},
+        'user_mappings': copy.deepcopy(dict(user_mappings)),
     }
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
\ No newline at end of file
+
+# filename -> hash of the last payload written, so a save that changed nothing
+# (e.g. toggling a queue limit to its current value) skips the disk entirely.
+_LAST_WRITTEN = {}
+# Saves run on a thread pool; one writer at a time so two snapshots of the
+# same guild can't interleave on disk. Also guards _LAST_WRITTEN.
+_WRITE_LOCK = threading.Lock()
+
+def _dumps(data) -> bytes:
+    """UTF-8 JSON bytes; orjson when installed (int guild ids need OPT_NON_STR_KEYS)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # something orjson won't encode; let stdlib json have a go
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def write_data(guild_id, data):
+    filename = os.path.join(DATA_DIR, f'guild_{guild_id}.json')
+    payload = _dumps(data)
+    digest = hash(payload)
+    with _WRITE_LOCK:
+        if _LAST_WRITTEN.get(filename) == digest and os.path.exists(filename):
+            return
+        # write a sibling temp file and swap it in, so readers (and a crash
+        # mid-write) only ever see a complete old or new file
+        fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, prefix=f'.guild_{guild_id}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, filename)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        _LAST_WRITTEN[filename] = digest
+
+def save_data(guild_id, queues, playlists, user_mappings):
+    write_data(guild_id, snapshot_data(queues, playlists, user_mappings))
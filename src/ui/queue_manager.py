@@ -200,8 +200,7 @@ class QueueManagerView(discord.ui.View):
                 if not self._is_authorized(interaction.user):
                     return await self._reject(interaction)
 
-                items_local = list(self.queue)
-                q_len_local = len(items_local)
+                q_len_local = len(self.queue)
                 if q_len_local == 0:
                     return await interaction.response.defer(ephemeral=True)
 
@@ -227,10 +226,10 @@ class QueueManagerView(discord.ui.View):
                 if src == dst:
                     return await interaction.response.defer(ephemeral=True)
 
-                track = items_local.pop(src)
-                items_local.insert(dst, track)
-                self.queue.clear()
-                self.queue.extend(items_local)
+                # move in place on the deque; no full-queue copy
+                track = self.queue[src]
+                del self.queue[src]
+                self.queue.insert(dst, track)
 
                 # update selection to the new location
                 self.selected_index = dst
@@ -302,19 +301,17 @@ class QueueManagerView(discord.ui.View):
         if not self._is_authorized(interaction.user):
             return await self._reject(interaction)
 
-        items = list(self.queue)
-        if not items:
+        q = self.queue
+        if not q:
             return await interaction.response.defer(ephemeral=True)
 
         # use selected song if available, otherwise last
-        idx = self.selected_index if self.selected_index is not None else (len(items) - 1)
-        if idx <= 0 or idx >= len(items):
+        idx = self.selected_index if self.selected_index is not None else (len(q) - 1)
+        if idx <= 0 or idx >= len(q):
             # nothing to move
             return await interaction.response.defer(ephemeral=True)
 
-        items[idx - 1], items[idx] = items[idx], items[idx - 1]
-        self.queue.clear()
-        self.queue.extend(items)
+        q[idx - 1], q[idx] = q[idx], q[idx - 1]
         # keep selection on the moved item
         self.selected_index = idx - 1
 
@@ -329,19 +326,17 @@ class QueueManagerView(discord.ui.View):
         if not self._is_authorized(interaction.user):
             return await self._reject(interaction)
 
-        items = list(self.queue)
-        if not items:
+        q = self.queue
+        if not q:
             return await interaction.response.defer(ephemeral=True)
 
         # use selected song if available, otherwise first
         idx = self.selected_index if self.selected_index is not None else 0
-        if idx < 0 or idx >= len(items) - 1:
+        if idx < 0 or idx >= len(q) - 1:
             # nothing to move
             return await interaction.response.defer(ephemeral=True)
 
-        items[idx], items[idx + 1] = items[idx + 1], items[idx]
-        self.queue.clear()
-        self.queue.extend(items)
+        q[idx], q[idx + 1] = q[idx + 1], q[idx]
         self.selected_index = idx + 1
 
         await self._sync_message(interaction)
@@ -355,21 +350,18 @@ class QueueManagerView(discord.ui.View):
         if not self._is_authorized(interaction.user):
             return await self._reject(interaction)
 
-        items = list(self.queue)
-        if not items:
+        q = self.queue
+        if not q:
             return await interaction.response.defer(ephemeral=True)
 
         idx = self.selected_index if self.selected_index is not None else 0
-        if idx < 0 or idx >= len(items):
-            return await interaction.response.defer(ephemeral=True)
-
-        try:
-            items.pop(idx)
-        except Exception:
+        if idx < 0 or idx >= len(q):
             return await interaction.response.defer(ephemeral=True)
 
-        self.queue.clear()
-        self.queue.extend(items)
+        # rotate the target to the front, drop it, rotate back
+        q.rotate(-idx)
+        q.popleft()
+        q.rotate(idx)
 
         # after removal, clear selection
         self.selected_index = None
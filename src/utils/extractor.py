@@ -3,10 +3,11 @@ import re
 import html
 import json
 import subprocess
-import requests
 from typing import Optional, Dict, Tuple, List
 from bs4 import BeautifulSoup
 
+from src.utils.http import SESSION
+
 # Import extraction functions from extractor module
 from src.utils.song_scraper import (
     extract_lyrics, 
@@ -74,7 +75,7 @@ def _normalize_suno_short(url: str) -> str:
     """suno.com/s/<short> -> suno.com/song/<uuid> (follow redirect)."""
     try:
         if "suno.com/s/" in url and "suno.com/song/" not in url:
-            r = requests.head(url, allow_redirects=True, timeout=10)
+            r = SESSION.head(url, allow_redirects=True, timeout=10)
             if r.url:
                 return r.url
     except Exception:
@@ -152,7 +153,7 @@ def extract_song_info(url: str) -> dict:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = SESSION.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             raw_html = response.text
             # Try lxml first (faster), fall back to html.parser (always available)
@@ -0,0 +1,17 @@
+# src/utils/http.py
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# One keep-alive pool shared by the extractor, scrapers and prefetch, so repeat
+# fetches from suno.com / the CDN reuse TCP+TLS connections instead of
+# handshaking on every call. Requests pass their own headers; nothing
+# per-request is stored on the session.
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))  # connections kept per host
+
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(1, HTTP_POOL_SIZE))
+
+SESSION = requests.Session()
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
@@ -2,9 +2,10 @@
 import os
 import re
 import tempfile
-import requests
 from urllib.parse import urlparse
 
+from src.utils.http import SESSION
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0",
     "Accept": "*/*",
@@ -43,8 +44,9 @@ def prefetch_to_file(
     Stream a remote URL to a local file using an atomic write.
 
     - full_download=True (default): fetch the entire file and return the final path.
-    - full_download=False AND max_bytes set: fetch ONLY up to max_bytes, then delete
-      the partial and return None (used for 'warmup' priming; not for playback).
+    - full_download=False AND max_bytes set: ask for ONLY the first max_bytes with a
+      Range request, read and discard them, and return None (used for 'warmup'
+      priming; not for playback). Nothing is written to disk in this mode.
 
     Never leaves a '.part' file behind on errors. Returns final file path (str) on success
     for full downloads, else None.
@@ -60,31 +62,32 @@ def prefetch_to_file(
     r = None
     fd = None
     tmp_path = None
+    warmup = not full_download and bool(max_bytes)
+    if warmup:
+        # CDN answers 206 with just this slice; if it ignores Range we still stop at max_bytes
+        hdrs["Range"] = f"bytes=0-{max_bytes - 1}"
     try:
-        r = requests.get(url, headers=hdrs, stream=True, timeout=timeout)
+        r = SESSION.get(url, headers=hdrs, stream=True, timeout=timeout)
         r.raise_for_status()
 
+        if warmup:
+            read = 0
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                if not chunk:
+                    break
+                read += len(chunk)
+                if read >= max_bytes:
+                    break
+            return None
+
         ext = _guess_ext(url, r.headers.get("Content-Type"))
         fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix=ext + ".part")
-        written = 0
 
         with os.fdopen(fd, "wb") as f:
             for chunk in r.iter_content(chunk_size=256 * 1024):
                 if not chunk:
                     break
                 f.write(chunk)
-                written += len(chunk)
-                if not full_download and max_bytes and written >= max_bytes:
-                    break
-
-        # Warmup path: delete partial and return None
-        if not full_download and max_bytes:
-            try:
-                if tmp_path and os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            except Exception:
-                pass
-            return None
 
         # Commit atomically (drop ".part")
         final_path = tmp_path[:-5] if tmp_path and tmp_path.endswith(".part") else tmp_path
@@ -99,6 +102,9 @@ def prefetch_to_file(
         except Exception:
             pass
         return None
+    finally:
+        if r is not None:
+            r.close()  # release the pooled connection even when we stopped reading early
 
 
 def prefetch_warmup(
@@ -5,22 +5,31 @@ from typing import MutableSequence, TypeVar, Union
 
 T = TypeVar("T")
 _RngLike = Union[None, int, random.Random]
+_RNG = random.Random()  # shared default; seeding a fresh Random per call costs a urandom read
 
 def _normalize_rng(rng: _RngLike) -> random.Random:
     if isinstance(rng, random.Random):
         return rng
     if isinstance(rng, int):
         return random.Random(rng)
-    return random.Random()
+    return _RNG
 
-def shuffle_displacing_first_inplace(seq: MutableSequence[T], *, rng: _RngLike = None) -> None:
-    """Guarantee original first element leaves index 0; no-op for len < 2."""
+def shuffle_displacing_first_inplace(
+    seq: MutableSequence[T], *, rng: _RngLike = None, depth: int | None = None
+) -> None:
+    """
+    Guarantee original first element leaves index 0; no-op for len < 2.
+    With `depth`, only the first `depth` slots are drawn (partial Fisher-Yates):
+    they're uniform over the whole sequence, the tail is left mostly in order.
+    """
     n = len(seq)
     if n < 2:
         return
+    k = n if depth is None or depth <= 0 else min(depth, n)
     rnd = _normalize_rng(rng)
-    j0 = rnd.randrange(1, n)               # forces displacement of the first element
+    randrange = rnd.randrange
+    j0 = randrange(1, n)                   # forces displacement of the first element
     seq[0], seq[j0] = seq[j0], seq[0]
-    for i in range(1, n):
-        j = rnd.randrange(i, n)
+    for i in range(1, k):
+        j = randrange(i, n)
         seq[i], seq[j] = seq[j], seq[i]
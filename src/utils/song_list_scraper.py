@@ -1,9 +1,10 @@
 # src/utils/scraper.py
 import re
 import html
-import requests
 from urllib.parse import urljoin
 
+from src.utils.http import SESSION
+
 # Common UA used for requests
 UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -122,7 +123,7 @@ def scrape_suno_songs(source: str, limit: int = 100) -> list[dict]:
         "Connection": "keep-alive",
     }
 
-    r = requests.get(url, headers=headers, timeout=15)
+    r = SESSION.get(url, headers=headers, timeout=15)
     r.raise_for_status()
     html_text = r.text
 
@@ -165,8 +166,7 @@ def _get(url, session=None, timeout=15):
     Previously, this could fall back to Playwright when bot protection was detected.
     Now it returns the raw requests.Response object.
     """
-    import requests as _requests
-    s = session or _requests.Session()
-    s.headers.update({"User-Agent": UA, "Accept": "text/html,application/xhtml+xml"})
-    resp = s.get(url, timeout=timeout)
+    s = session or SESSION
+    headers = {"User-Agent": UA, "Accept": "text/html,application/xhtml+xml"}
+    resp = s.get(url, headers=headers, timeout=timeout)
     return resp
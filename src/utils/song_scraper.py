@@ -13,6 +13,8 @@ import logging
 import codecs
 from typing import Dict, Optional
 
+from src.utils.http import SESSION
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -218,7 +220,7 @@ def scrape_suno_song(file_path_or_url: str, debug: bool = True) -> Dict[str, Opt
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(file_path_or_url, headers=headers, timeout=10)
+            response = SESSION.get(file_path_or_url, headers=headers, timeout=10)
             response.raise_for_status()
             html_content = response.text
         
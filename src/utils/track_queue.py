@@ -0,0 +1,134 @@
+# track_queue.py
+from __future__ import annotations
+from collections import Counter, deque
+from typing import Iterable
+
+
+class TrackQueue(deque):
+    """
+    deque of track dicts that keeps per-requester and autofill tallies in step
+    with every mutation, so per-user cap checks and filler purges don't have to
+    scan the whole queue. Autofill tracks never count against a requester.
+
+    Tallies are computed on insert/remove; don't flip `_autofill` or
+    `requester_id` on a track while it sits in the queue.
+    """
+
+    def __init__(self, iterable: Iterable[dict] = ()):
+        super().__init__()
+        self.user_counts: Counter = Counter()
+        self.autofill_count = 0
+        self.extend(iterable)
+
+    # ---- tallies -------------------------------------------------------
+    def _add(self, track: dict) -> None:
+        if track.get("_autofill"):
+            self.autofill_count += 1
+            return
+        uid = track.get("requester_id")
+        if uid is not None:
+            self.user_counts[uid] += 1
+
+    def _drop(self, track: dict) -> None:
+        if track.get("_autofill"):
+            self.autofill_count -= 1
+            return
+        uid = track.get("requester_id")
+        if uid is not None:
+            n = self.user_counts[uid] - 1
+            if n > 0:
+                self.user_counts[uid] = n
+            else:
+                del self.user_counts[uid]
+
+    def _recount(self) -> None:
+        self.user_counts.clear()
+        self.autofill_count = 0
+        for t in self:
+            self._add(t)
+
+    # ---- mutators ------------------------------------------------------
+    def append(self, track: dict) -> None:
+        self._add(track)
+        super().append(track)
+
+    def appendleft(self, track: dict) -> None:
+        self._add(track)
+        super().appendleft(track)
+
+    def extend(self, iterable: Iterable[dict]) -> None:
+        items = list(iterable)
+        for t in items:
+            self._add(t)
+        super().extend(items)
+
+    def extendleft(self, iterable: Iterable[dict]) -> None:
+        items = list(iterable)
+        for t in items:
+            self._add(t)
+        super().extendleft(items)
+
+    def insert(self, i: int, track: dict) -> None:
+        super().insert(i, track)
+        self._add(track)
+
+    def pop(self) -> dict:
+        t = super().pop()
+        self._drop(t)
+        return t
+
+    def popleft(self) -> dict:
+        t = super().popleft()
+        self._drop(t)
+        return t
+
+    def remove(self, track: dict) -> None:
+        super().remove(track)
+        self._drop(track)
+
+    def clear(self) -> None:
+        super().clear()
+        self.user_counts.clear()
+        self.autofill_count = 0
+
+    def __delitem__(self, i: int) -> None:
+        t = self[i]
+        super().__delitem__(i)
+        self._drop(t)
+
+    def __setitem__(self, i: int, track: dict) -> None:
+        old = self[i]
+        super().__setitem__(i, track)
+        self._drop(old)
+        self._add(track)
+
+    def __iadd__(self, iterable: Iterable[dict]) -> "TrackQueue":
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, n: int) -> "TrackQueue":
+        super().__imul__(n)
+        self._recount()
+        return self
+
+    # deque's C copy/concat/repeat paths skip the overrides above, so build
+    # new queues through __init__ instead
+    def __add__(self, other: Iterable[dict]) -> "TrackQueue":
+        if not isinstance(other, deque):
+            return NotImplemented
+        return type(self)([*self, *other])
+
+    def __mul__(self, n: int) -> "TrackQueue":
+        return type(self)(list(self) * n)
+
+    __rmul__ = __mul__
+
+    def copy(self) -> "TrackQueue":
+        return type(self)(self)
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        # the default reduce ships the tallies in __dict__ and then re-appends
+        # every item on top of them
+        return type(self), (list(self),)
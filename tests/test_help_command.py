@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+from discord.ext import commands
+
+
+@pytest.fixture(scope="module")
+def help_cls(tmp_path_factory):
+    # src.bot opens the SQLite DB at import time; keep it out of the repo
+    mp = pytest.MonkeyPatch()
+    mp.setenv("SUNO_RADIO_DB", str(tmp_path_factory.mktemp("db") / "test.db"))
+    from src.bot import MusicHelpCommand
+    yield MusicHelpCommand
+    mp.undo()
+
+
+class _Channel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, *args, **kwargs):
+        self.sent.append(kwargs)
+
+
+class _Radio(commands.Cog, name="Radio"):
+    """Radio commands."""
+
+    @commands.command(name="play", help="Play a song")
+    async def play(self, ctx):
+        pass
+
+    @commands.has_permissions(administrator=True)
+    @commands.command(name="wipe", help="Admin: wipe everything")
+    async def wipe(self, ctx):
+        pass
+
+
+def _make_bot():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none(), help_command=None)
+    asyncio.run(bot.add_cog(_Radio()))
+    return bot
+
+
+def _ctx(bot, *, guild=None):
+    return SimpleNamespace(bot=bot, guild=guild, channel=_Channel(), clean_prefix="!", prefix="!")
+
+
+def test_caches_are_declared_on_the_class(help_cls):
+    for name in ("_admin_cache", "_help_fp", "_help_cache", "_sig_cache",
+                 "_visible_cache", "_VISIBLE_TTL", "_subs_cache", "_PERM_CHECKS"):
+        assert hasattr(help_cls, name), name
+
+
+def test_is_admin_command_reads_has_permissions(help_cls):
+    bot = _make_bot()
+    h = help_cls()
+    assert h._is_admin_command(bot.get_command("wipe")) is True
+    assert h._is_admin_command(bot.get_command("play")) is False
+
+
+def test_command_callback_admin_denied_without_guild(help_cls):
+    bot = _make_bot()
+    h = help_cls()
+    ctx = _ctx(bot)
+    asyncio.run(h.command_callback(ctx, command="admin"))
+
+    assert help_cls._help_fp == help_cls._help_fingerprint(bot)
+    (sent,) = ctx.channel.sent
+    assert sent["embed"].title == "🔒 Admin Help"
+
+
+def test_send_cog_help_uses_cached_non_admin_bucket(help_cls):
+    bot = _make_bot()
+    h = help_cls()
+    h.context = _ctx(bot)
+    help_cls._help_cache.clear()
+    asyncio.run(h.send_cog_help(bot.get_cog("Radio")))
+
+    (sent,) = h.context.channel.sent
+    (embed,) = sent["embeds"]
+    value = embed.fields[0].value
+    assert "!play" in value
+    assert "!wipe" not in value  # admin-only stays in !help admin
+    assert "!" in help_cls._help_cache
+
+
+def test_hiding_a_command_invalidates_cached_help(help_cls):
+    bot = _make_bot()
+    h = help_cls()
+    h.context = _ctx(bot)
+    asyncio.run(h.command_callback(h.context, command="admin"))
+    assert [c.name for c, _ in h._build_help_cache(bot)["cogs"]["Radio"]] == ["play"]
+
+    bot.get_command("play").hidden = True
+    asyncio.run(h.command_callback(h.context, command="admin"))
+    assert "Radio" not in h._build_help_cache(bot)["cogs"]
@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("discord")
+
+
+@pytest.fixture(scope="module")
+def music(tmp_path_factory):
+    mp = pytest.MonkeyPatch()
+    mp.setenv("SUNO_RADIO_DB", str(tmp_path_factory.mktemp("db") / "test.db"))
+    from src.cogs import music
+    yield music
+    mp.undo()
+
+
+def _values(embed, name):
+    return [f.value for f in embed.fields if f.name == name]
+
+
+def test_long_lyrics_end_with_truncation_marker(music):
+    embed = music.build_song_info_embed({"title": "t", "prompt": "p", "lyrics": "line\n" * 3000})
+
+    assert len(embed) <= 6000
+    assert _values(embed, "**Lyrics**")
+    assert embed.fields[-1].value == music._TRUNCATED_NOTE
+
+
+def test_huge_prompt_keeps_lyrics_header(music):
+    embed = music.build_song_info_embed({"title": "t", "prompt": "p " * 6000, "lyrics": "la\n" * 500})
+
+    assert len(embed) <= 6000
+    assert music._TRUNCATED_NOTE in [f.value for f in embed.fields]
+    assert _values(embed, "**Lyrics**")
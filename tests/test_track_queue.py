@@ -0,0 +1,99 @@
+import copy
+from collections import Counter
+
+import pytest
+
+from src.utils.track_queue import TrackQueue
+
+
+def _user(uid):
+    return {"title": f"u{uid}", "requester_id": uid}
+
+
+def _filler():
+    return {"title": "filler", "_autofill": True}
+
+
+def _expected(q):
+    """Tallies recomputed from scratch, to compare with the incremental ones."""
+    users = Counter(t["requester_id"] for t in q if not t.get("_autofill") and t.get("requester_id") is not None)
+    return users, sum(1 for t in q if t.get("_autofill"))
+
+
+def _assert_in_step(q):
+    users, fillers = _expected(q)
+    assert q.user_counts == users
+    assert q.autofill_count == fillers
+    assert all(n > 0 for n in q.user_counts.values())
+
+
+@pytest.fixture
+def q():
+    return TrackQueue([_user(1), _user(2), _filler(), _user(1)])
+
+
+def test_init_counts(q):
+    assert q.user_counts == {1: 2, 2: 1}
+    assert q.autofill_count == 1
+
+
+def test_append_and_extend(q):
+    q.append(_user(3))
+    q.appendleft(_filler())
+    q.extend([_user(2), _filler()])
+    q.extendleft([_user(4)])
+    q += [_user(1)]
+    _assert_in_step(q)
+    assert q.user_counts[1] == 3
+
+
+def test_insert_setitem_delitem(q):
+    q.insert(1, _user(5))
+    _assert_in_step(q)
+    q[2] = _filler()  # replaces a user-2 track
+    _assert_in_step(q)
+    assert 2 not in q.user_counts
+    del q[0]
+    _assert_in_step(q)
+
+
+def test_pop_remove_clear(q):
+    q.pop()
+    q.popleft()
+    _assert_in_step(q)
+    q.remove(q[-1])  # the filler
+    _assert_in_step(q)
+    assert q.autofill_count == 0
+    q.clear()
+    assert not q.user_counts and q.autofill_count == 0
+
+
+def test_rotate_keeps_counts(q):
+    before = (Counter(q.user_counts), q.autofill_count)
+    q.rotate(2)
+    q.rotate(-3)
+    assert (q.user_counts, q.autofill_count) == before
+
+
+def test_copies_are_independent(q):
+    for c in (q.copy(), copy.copy(q), copy.deepcopy(q)):
+        assert isinstance(c, TrackQueue)
+        _assert_in_step(c)
+        c.append(_user(9))
+        assert 9 not in q.user_counts
+    _assert_in_step(q)
+
+
+def test_repeat_and_concat(q):
+    doubled = q * 2
+    assert isinstance(doubled, TrackQueue)
+    _assert_in_step(doubled)
+    _assert_in_step(2 * q)
+    _assert_in_step(q + TrackQueue([_filler()]))
+    _assert_in_step(q)
+
+    q *= 2
+    _assert_in_step(q)
+    assert q.user_counts[1] == 4
+    q *= 0
+    assert not q and not q.user_counts and q.autofill_count == 0